@@ -5,57 +5,174 @@ __author__ = "Stéphane Brunner"
 __email__ = "stephane.brunner@gmail.com"
 __license__ = "Apache-2.0"
 
-
-try:
-    from importlib.metadata import version
-except ImportError:
-    from importlib_metadata import version
-
 import argparse
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
 import gettext
+import glob
+import hashlib
+import heapq
+import http
+import importlib
 import io
 import json
+import mmap
+import os
+import posixpath
 import re
-import subprocess  # nosec
-from collections.abc import Callable, Iterable, Mapping, Sequence
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import Any, Literal
-from urllib.parse import quote, urlsplit
+from typing import IO, TYPE_CHECKING, Any, Literal, NamedTuple
+from urllib.parse import quote, unquote, urldefrag, urljoin, urlsplit
+
+# The dependencies are imported when they are first used, to start the command line quickly
+if TYPE_CHECKING:
+    from http.client import HTTPConnection, HTTPMessage, HTTPResponse
+
+    from babel.support import LazyProxy
+
+
+def __getattr__(name: str) -> Any:
+    """Get the module attributes that are computed when they are first used."""
+    if name == "__version__":
+        return _get_version()
+    if name in ("PROPERTY_NAMES", "TYPES"):
+        labels = _PROPERTY_NAME_LABELS if name == "PROPERTY_NAMES" else _TYPE_LABELS
+        # The `$defs` keyword isn't translated
+        value = globals()[name] = {
+            key: message if key == "$defs" else t(message) for key, message in labels.items()
+        }
+        return value
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
 
-import markdown
-import yaml
-from babel import default_locale, negotiate_locale
-from babel.lists import format_list
-from babel.support import LazyProxy
+@functools.cache
+def _get_version() -> str:
+    """Get the version of the package."""
+    try:
+        from importlib.metadata import version  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+    except ImportError:
+        from importlib_metadata import version  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
 
-__version__ = version("jsonschema2md")
-_translations_cache: dict[str, gettext.GNUTranslations] = {}
+    return version("jsonschema2md")
 
 
+@functools.cache
 def get_locales() -> tuple[str, ...]:
     """Get the list of available locales."""
-    languages = (Path(__file__).parent / "locales").glob("*/LC_MESSAGES/messages.mo")
-    languages = (p.parent.parent for p in languages)
+    try:
+        # The manifest generated by `scripts/build.py`
+        manifest = importlib.import_module(f"{__name__}._locales")
+    except ImportError:
+        # E.g. in a development checkout
+        languages = (Path(__file__).parent / "locales").glob("*/LC_MESSAGES/messages.mo")
+        return ("en", "en_US", *sorted(p.parent.parent.name for p in languages))
+    return ("en", "en_US", *manifest.LOCALES)
 
-    return ("en", "en_US", *sorted(lang.name for lang in languages))
 
+# The locale of the rendering running in the current thread or task, see `_get_locale`
+_locale_context: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "jsonschema2md_locale", default=None
+)
 
-def _(message: str) -> str:
-    """Translate a message using gettext."""
-    if Parser.current_locale is None or Parser.current_locale in ("en", "en_US"):
-        return message
-
-    if not _translations_cache.get(Parser.current_locale):
-        _translations_cache[Parser.current_locale] = gettext.translation(
-            "messages",
-            localedir=str(Path(__file__).parent / "locales"),
-            languages=[Parser.current_locale],
+
+def _get_locale() -> str | None:
+    """Get the locale of the current context, else the process-wide `Parser.current_locale`."""
+    locale = _locale_context.get()
+    return Parser.current_locale if locale is None else locale
+
+
+@contextlib.contextmanager
+def _use_locale(locale: str | None) -> Iterator[None]:
+    """Use the locale in the current context, if it's not None, and restore the previous one at the end."""
+    if locale is None:
+        yield
+        return
+    from babel import negotiate_locale  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+    previous_locale = _locale_context.get()
+    _locale_context.set(negotiate_locale((locale,), get_locales()))
+    try:
+        yield
+    finally:
+        # Not `reset`, the generators can be closed from another context
+        _locale_context.set(previous_locale)
+
+
+class _MessageTable(dict[str, str]):
+    """
+    The translated messages of a locale, each message is translated once, when it's first used.
+
+    The table is called like `_`, to be bound to `_` in the rendering functions, and the labels
+    (`types`, `keyword_names`, `section_titles`, `composition_labels`) are plain strings
+    translated when the table is created.
+    """
+
+    __call__ = dict.__getitem__
+
+    def __init__(self, locale: str | None) -> None:
+        super().__init__()
+        self.locale = locale
+        self._translations: gettext.NullTranslations = (
+            gettext.NullTranslations()
+            if locale is None or locale in ("en", "en_US")
+            else gettext.translation(
+                "messages",
+                localedir=str(Path(__file__).parent / "locales"),
+                languages=[locale],
+            )
         )
-    return _translations_cache[Parser.current_locale].gettext(message)
+        self.types = self._labels(_TYPE_LABELS)
+        self.keyword_names = self._labels(_KEYWORD_NAMES)
+        self.section_titles = self._labels(_SECTION_TITLES)
+        self.composition_labels = self._labels(_COMPOSITION_LABELS)
+
+    def __missing__(self, message: str) -> str:
+        translated = self._translations.gettext(message)
+        self[message] = translated
+        return translated
+
+    def _labels(self, labels: Mapping[str, str]) -> dict[str, str]:
+        """Translate the labels marked with `N_`."""
+        return {key: self[message] for key, message in labels.items()}
+
+
+# The message tables by locale
+_message_tables: dict[str | None, _MessageTable] = {}
+
+
+def _get_messages(locale: str | None = None) -> _MessageTable:
+    """Get the message table of a locale, by default of the current locale."""
+    if locale is None:
+        locale = _get_locale()
+    messages = _message_tables.get(locale)
+    if messages is None:
+        messages = _message_tables.setdefault(locale, _MessageTable(locale))
+    return messages
+
+
+def _(message: str) -> str:
+    """Translate a message in the current locale."""
+    return _get_messages()[message]
+
 
+def N_(message: str) -> str:  # noqa: N802
+    """Mark a message to translate, it's translated by the message tables."""
+    return message
 
-def t(message: str) -> LazyProxy:
+
+def t(message: str) -> "LazyProxy":
     """Translate a message using gettext only when it's used."""
+    from babel.support import LazyProxy  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
     return LazyProxy(_, message, enable_cache=False)
 
 
@@ -94,12 +211,67 @@ def _format_list(
     locale: str | None = None,
 ) -> str:
     if locale is None:
-        locale = Parser.current_locale
+        locale = _get_locale()
 
     # Prune falsy values.
     iter_ = filter(None, iter_)
 
-    return format_list(tuple(iter_), style, locale)
+    return _format_list_items(tuple(iter_), style, locale)
+
+
+# The replacement list styles, from `babel.lists`, based on the aliases of the CLDR root locale
+_LIST_STYLE_FALLBACKS = {
+    "or-narrow": ("or-short", "or"),
+    "or-short": ("or",),
+    "standard-narrow": ("standard-short", "standard"),
+    "standard-short": ("standard",),
+    "unit": ("unit-short", "standard"),
+    "unit-narrow": ("unit-short", "unit", "standard"),
+    "unit-short": ("standard",),
+}
+
+
+@functools.cache
+def _list_formatter(style: str, locale: str | None) -> Callable[[Sequence[str]], str]:
+    """Get a function formatting a list like `babel.lists.format_list`, with the patterns of the locale."""
+    from babel import Locale, default_locale  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+    babel_locale = Locale.parse(locale or default_locale())
+    for list_style in (style, *_LIST_STYLE_FALLBACKS.get(style, ())):
+        if list_style in babel_locale.list_patterns:
+            patterns = babel_locale.list_patterns[list_style]
+            break
+    else:
+        message = (
+            f"Locale {babel_locale} does not support list formatting style {style!r} "
+            f"(supported are {sorted(babel_locale.list_patterns)})"
+        )
+        raise ValueError(message)
+
+    pair = patterns["2"].format if "2" in patterns else None
+    start = patterns["start"].format
+    middle = patterns["middle"].format
+    end = patterns["end"].format
+
+    def format_items(items: Sequence[str]) -> str:
+        if not items:
+            return ""
+        if len(items) == 1:
+            return items[0]
+        if len(items) == 2 and pair is not None:
+            return pair(*items)
+        result = start(items[0], items[1])
+        for item in items[2:-1]:
+            result = middle(result, item)
+        return end(result, items[-1])
+
+    return format_items
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_list_items(items: tuple[str, ...], style: str, locale: str | None) -> str:
+    """Format a list of strings, the recently formatted lists are kept."""
+    return _list_formatter(style, locale)(items)
 
 
 def normalize_file_name(domain: str, file_name: str) -> tuple[str, str]:
@@ -124,24 +296,1132 @@ def normalize_file_name(domain: str, file_name: str) -> tuple[str, str]:
     return (parts[0].strip("/"), f".{parts[1]}" if len(parts) == 2 else "")
 
 
-PROPERTY_NAMES = {
-    "items": t("Items"),
-    "contains": t("Contains"),
-    "definitions": t("Definitions"),
+# The messages of `PROPERTY_NAMES` and `TYPES`, see `__getattr__`
+_PROPERTY_NAME_LABELS = {
+    "items": N_("Items"),
+    "contains": N_("Contains"),
+    "definitions": N_("Definitions"),
     "$defs": "$defs",
 }
 
-TYPES = {
-    "array": t("array"),
-    "boolean": t("boolean"),
-    "null": t("null"),
-    "integer": t("integer"),
-    "number": t("number"),
-    "object": t("object"),
-    "string": t("string"),
+_TYPE_LABELS = {
+    "array": N_("array"),
+    "boolean": N_("boolean"),
+    "null": N_("null"),
+    "integer": N_("integer"),
+    "number": N_("number"),
+    "object": N_("object"),
+    "string": N_("string"),
+}
+
+# A pattern without any of these characters is a literal string
+_REGEX_SPECIAL_CHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+# Back references and conditional patterns depend on the group numbers or names
+_REGEX_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+# A command line input with one of these characters is a glob pattern
+_GLOB_CHARACTERS = re.compile(r"[*?\[]")
+# A command line `input:output` pair, the input isn't a single letter that is a Windows drive
+_INPUT_OUTPUT_PAIR = re.compile(r"(.{2,}):(.+)")
+
+# The redirections followed by `HttpLoader`
+_REDIRECTION_STATUSES = frozenset((301, 302, 303, 307, 308))
+_MAX_REDIRECTIONS = 5
+# The archives read by `ZipLoader` and `TarLoader`
+_ZIP_SUFFIXES = (".zip",)
+_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+# Keywords that don't change the description of a subschema, only its children
+_CHILDREN_KEYWORDS = frozenset(
+    (
+        "properties",
+        "patternProperties",
+        "items",
+        "contains",
+        "definitions",
+        "$defs",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "examples",
+        "required",
+        "dependentRequired",
+    ),
+)
+
+
+# Names of the subschemas that are named by their keyword
+_KEYWORD_NAMES = {
+    **_PROPERTY_NAME_LABELS,
+    "additionalProperties": N_("Additional properties"),
+    "unevaluatedProperties": N_("Unevaluated properties"),
+}
+
+# Titles of the sections of a schema document
+_SECTION_TITLES = {
+    "items": N_("Items"),
+    "additionalProperties": N_("Additional properties"),
+    "unevaluatedProperties": N_("Unevaluated properties"),
+    "patternProperties": N_("Pattern Properties"),
+    "properties": N_("Properties"),
+    "definitions": N_("Definitions"),
+    "$defs": N_("Definitions"),
+    "examples": N_("Examples"),
+}
+
+_COMPOSITION_LABELS = {
+    "allOf": N_("All of"),
+    "anyOf": N_("Any of"),
+    "oneOf": N_("One of"),
 }
 
 
+def _description_schema(obj: dict[str, Any]) -> dict[str, Any]:
+    """Get the keywords of a subschema that are used in its description."""
+    return {
+        # Only `False` changes the description of the additional properties
+        key: value is not False if key in ("additionalProperties", "unevaluatedProperties") else value
+        for key, value in obj.items()
+        if key not in _CHILDREN_KEYWORDS
+    }
+
+
+def _fragment_key(schema: dict[str, Any]) -> str:
+    """Get the fragment cache key of the keywords of a subschema from `_description_schema`."""
+    # The `repr` of the JSON values is exact and much cheaper than a hash of their sorted dump,
+    # the same keywords in another order only miss the cache
+    return repr(schema)
+
+
+# Kinds of task in the `Parser._build_object` work stack
+_TASK_NODE = 0
+_TASK_RECORD = 1
+
+
+class DocumentHeader(NamedTuple):
+    """Title and description of a schema document."""
+
+    title: str | None
+    description: str | None
+
+
+class SectionHeader(NamedTuple):
+    """Header of a section of a schema document, e.g. the properties."""
+
+    keyword: str
+
+
+class DocumentExamples(NamedTuple):
+    """Examples of a schema document."""
+
+    examples: list[Any]
+
+
+class DefinitionStart(NamedTuple):
+    """Start of the records of a definition, the errors in a definition are reported by name."""
+
+    keyword: str
+    name: str
+
+
+class DefinitionEnd(NamedTuple):
+    """End of the records of a definition."""
+
+    keyword: str
+    name: str
+
+
+class SchemaNode(NamedTuple):
+    """
+    A subschema, with the keywords used in its description.
+
+    The children follow in the records, up to the matching `SchemaNodeEnd`.
+    """
+
+    indent_level: int
+    path: str
+    # The keyword (e.g. `items`) when `keyword_name` is set, translated when rendered
+    name: str | None
+    keyword_name: bool
+    name_monospace: bool
+    required: bool
+    dependent_required: tuple[str, ...]
+    # The keywords used in the description, from `_description_schema`, without the children
+    schema: dict[str, Any]
+    ignored: bool
+    has_children: bool
+    has_collapsible_children: bool
+
+
+class SchemaNodeEnd(NamedTuple):
+    """End of a subschema, after its children."""
+
+    indent_level: int
+    examples: list[Any] | None
+    # The children are in an expandable block when `collapse_children` is set
+    collapsible: bool
+
+
+class ListNode(NamedTuple):
+    """A list of subschemas, e.g. the `items` of a tuple; the subschemas follow in the records."""
+
+    indent_level: int
+    name: str | None
+    keyword_name: bool
+
+
+class CompositionLabel(NamedTuple):
+    """Label of the subschemas of a schema composition keyword, e.g. `allOf`."""
+
+    indent_level: int
+    keyword: str
+
+
+# A record of the intermediate representation of a schema, see `Parser.iter_ir`
+SchemaRecord = (
+    DocumentHeader
+    | SectionHeader
+    | DocumentExamples
+    | DefinitionStart
+    | DefinitionEnd
+    | SchemaNode
+    | SchemaNodeEnd
+    | ListNode
+    | CompositionLabel
+)
+
+
+def _definition_error_message(keyword: str, name: str) -> str:
+    """Get the message of an error in a definition."""
+    return f"Error parsing {name} from {keyword} in schema, usually it occurs when the kind of def is not supported."
+
+
+class SchemaIndex:
+    """
+    Index of the subschemas of a JSON Schema document by JSON Pointer, `$id` and `$anchor`.
+
+    The document is walked once, then the references are resolved with dictionary lookups.
+
+    Examples
+    --------
+    >>> index = jsonschema2md.SchemaIndex(schema)
+    >>> pointer, subschema = index.resolve("#/definitions/Person")
+    """
+
+    # Keywords holding values instead of subschemas
+    _VALUE_KEYWORDS = frozenset(("const", "default", "enum", "examples"))
+    # Keywords holding subschemas by name, the names can be any string, e.g. `default`
+    _NAME_MAP_KEYWORDS = frozenset(
+        ("properties", "patternProperties", "definitions", "$defs", "dependentSchemas", "dependencies")
+    )
+
+    def __init__(self, document: Any) -> None:
+        """
+        Index a JSON Schema document.
+
+        Parameters
+        ----------
+        document : Any
+            The JSON Schema document.
+        """
+        self.document = document
+        self.base = ""
+        if isinstance(document, dict) and isinstance(document.get("$id"), str):
+            self.base = urldefrag(document["$id"]).url
+        # JSON Pointer (escaped, without `#`) to subschema
+        self.nodes: dict[str, Any] = {}
+        # Absolute `$id` to JSON Pointer
+        self.ids: dict[str, str] = {self.base: ""}
+        # `$anchor` to JSON Pointer
+        self.anchors: dict[str, str] = {}
+        self._resolved: dict[str, tuple[str, Any] | None] = {}
+        # Reference to resolution error
+        self.errors: dict[str, ValueError] = {}
+
+        # The nodes to walk, with whether the node is a schema, else a map of subschemas by name
+        stack: list[tuple[str, str, Any, bool]] = [("", self.base, document, True)]
+        while stack:
+            pointer, base, node, is_schema = stack.pop()
+            self.nodes[pointer] = node
+
+            if isinstance(node, list):
+                stack.extend(
+                    (f"{pointer}/{index}", base, value, True)
+                    for index, value in enumerate(node)
+                    if isinstance(value, dict | list)
+                )
+                continue
+            if not isinstance(node, dict):
+                continue
+            if not is_schema:
+                stack.extend(
+                    (f"{pointer}/{key.replace('~', '~0').replace('/', '~1')}", base, value, True)
+                    for key, value in node.items()
+                    if isinstance(value, dict | list)
+                )
+                continue
+
+            node_id = node.get("$id", node.get("id"))
+            if isinstance(node_id, str) and pointer:
+                node_url, fragment = urldefrag(urljoin(base, node_id))
+                if node_url != base or not fragment:
+                    base = node_url
+                    self.ids.setdefault(base, pointer)
+                elif fragment:
+                    # Location-independent identifier of draft 7 (`"$id": "#foo"`)
+                    self.anchors.setdefault(fragment, pointer)
+            if isinstance(node.get("$anchor"), str):
+                self.anchors.setdefault(node["$anchor"], pointer)
+
+            stack.extend(
+                (
+                    f"{pointer}/{key.replace('~', '~0').replace('/', '~1')}",
+                    base,
+                    value,
+                    key not in self._NAME_MAP_KEYWORDS,
+                )
+                for key, value in node.items()
+                if key not in self._VALUE_KEYWORDS and isinstance(value, dict | list)
+            )
+
+    def _lookup(self, ref: str) -> str | None:
+        """Get the JSON Pointer of a reference, `None` if it points outside of the document."""
+        url, fragment = urldefrag(urljoin(self.base, ref))
+        if url not in self.ids:
+            return None
+        pointer = self.ids[url]
+        fragment = unquote(fragment)
+        if not fragment:
+            return pointer
+        if fragment.startswith("/"):
+            return pointer + fragment
+        if fragment in self.anchors:
+            return self.anchors[fragment]
+        message = f"Unresolvable reference `{ref}`."
+        raise ValueError(message)
+
+    def resolve(self, ref: str) -> tuple[str, Any] | None:
+        """
+        Resolve a reference, following the subschemas that are only a reference.
+
+        The results are memoized, so each reference is resolved only once.
+
+        Parameters
+        ----------
+        ref : str
+            The reference, e.g. `#/definitions/Person`.
+
+        Returns
+        -------
+        tuple[str, Any] | None
+            The JSON Pointer and the referenced subschema, `None` if the reference points outside
+            of the document.
+
+        Raises
+        ------
+        ValueError
+            If the reference can't be resolved or is circular.
+        """
+        if ref in self._resolved:
+            return self._resolved[ref]
+        if ref in self.errors:
+            raise self.errors[ref]
+
+        try:
+            resolved = self._resolve(ref)
+        except ValueError as error:
+            self.errors[ref] = error
+            raise
+        self._resolved[ref] = resolved
+        return resolved
+
+    def _resolve(self, ref: str) -> tuple[str, Any] | None:
+        chain: list[str] = []
+        current_ref = ref
+        while True:
+            pointer = self._lookup(current_ref)
+            if pointer is None:
+                return None
+            if pointer in chain:
+                message = f"Circular reference `{ref}`."
+                raise ValueError(message)
+            if pointer not in self.nodes:
+                message = f"Unresolvable reference `{ref}`."
+                raise ValueError(message)
+            chain.append(pointer)
+
+            node = self.nodes[pointer]
+            if not (isinstance(node, dict) and len(node) == 1 and isinstance(node.get("$ref"), str)):
+                return pointer, node
+            # Follow the subschema that is only a reference
+            current_ref = node["$ref"]
+
+
+class DependencyGraph:
+    """
+    Graph of the references between the schema files parsed by `Parser.iter_file`.
+
+    Examples
+    --------
+    >>> parser.parse_file(Path("root.json"))
+    >>> parser.dependency_graph.topological_order()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        # The files referenced by each file
+        self.references: dict[str, set[str]] = {}
+        # The length of the shortest reference path from the root file to each file
+        self.depths: dict[str, int] = {}
+
+    def add_file(self, name: str, depth: int) -> None:
+        """Add a file, the files are added by increasing depth so the first depth is the shortest."""
+        self.depths.setdefault(name, depth)
+        self.references.setdefault(name, set())
+
+    def set_references(self, name: str, references: Iterable[str]) -> None:
+        """Set the files referenced by a file, their depth is lowered if needed."""
+        self.references[name] = set(references)
+        depth = self.depths[name] + 1
+        for reference in self.references[name]:
+            if self.depths.get(reference, depth) > depth:
+                self.depths[reference] = depth
+            self.add_file(reference, depth)
+
+    def update_depths(self, root: str) -> None:
+        """Compute the depths from the root file again, the files that aren't referenced anymore are removed."""
+        depths = {root: 0}
+        layer = [root]
+        while layer:
+            next_layer = []
+            for name in layer:
+                for reference in self.references.get(name, ()):
+                    if reference not in depths:
+                        depths[reference] = depths[name] + 1
+                        next_layer.append(reference)
+            layer = next_layer
+        self.depths = depths
+        self.references = {name: self.references.get(name, set()) for name in depths}
+
+    def files_at_depth(self, depth: int) -> list[str]:
+        """Get the sorted files at a depth."""
+        return sorted(name for name, file_depth in self.depths.items() if file_depth == depth)
+
+    def referenced_by(self) -> dict[str, set[str]]:
+        """Get the files that reference each file."""
+        result: dict[str, set[str]] = {name: set() for name in self.references}
+        for name, references in self.references.items():
+            for reference in references:
+                result[reference].add(name)
+        return result
+
+    def topological_order(self) -> list[str]:
+        """
+        Get the files with the referenced files before the files that reference them.
+
+        The cycles are broken by taking the first file by name.
+        """
+        referenced_by = self.referenced_by()
+        remaining = {name: references - {name} for name, references in self.references.items()}
+        ready = [name for name, references in remaining.items() if not references]
+        heapq.heapify(ready)
+        order = []
+        while remaining:
+            name = heapq.heappop(ready) if ready else min(remaining)
+            if name not in remaining:
+                continue
+            del remaining[name]
+            order.append(name)
+            for dependent in referenced_by[name]:
+                if dependent in remaining:
+                    remaining[dependent].discard(name)
+                    if not remaining[dependent]:
+                        heapq.heappush(ready, dependent)
+        return order
+
+    def to_json(self) -> dict[str, Any]:
+        """Export the graph to a JSON serializable object."""
+        referenced_by = self.referenced_by()
+        return {
+            "files": {
+                name: {
+                    "depth": self.depths[name],
+                    "references": sorted(self.references[name]),
+                    "referenced_by": sorted(referenced_by[name]),
+                }
+                for name in sorted(self.references)
+            },
+            "order": self.topological_order(),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "DependencyGraph":
+        """Import a graph exported by `to_json`."""
+        graph = cls()
+        for name, file in data["files"].items():
+            graph.depths[name] = file["depth"]
+            graph.references[name] = set(file["references"])
+        return graph
+
+    def to_dot(self) -> str:
+        """Export the graph to the Graphviz DOT language."""
+        names = sorted(self.references)
+        lines = ["digraph dependencies {\n"]
+        lines.extend(
+            [
+                f"  {json.dumps(name)} [label={json.dumps(f'{name} ({self.depths[name]})')}];\n"
+                for name in names
+            ],
+        )
+        lines.extend(
+            [
+                f"  {json.dumps(name)} -> {json.dumps(reference)};\n"
+                for name in names
+                for reference in sorted(self.references[name])
+            ],
+        )
+        lines.append("}\n")
+        return "".join(lines)
+
+
+class DocumentCache:
+    """
+    Process-wide cache of the loaded JSON Schema files, shared by all the `Parser` instances.
+
+    An entry holds the text and the parsed JSON of a file, it's keyed by the resolved path of the
+    file, and the file is loaded again when its modification time or its size changed. The parsed
+    documents are shared, they must not be modified.
+
+    The size of the cache is the size of the source files, the memory used by an entry is larger:
+    the parsed JSON of a file takes several times its size in bytes (about 4 times for an indented
+    file), plus the text.
+
+    Examples
+    --------
+    >>> jsonschema2md.document_cache.invalidate(Path("schema.json"))
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        max_size : int, default 64 MiB
+            The maximum size of the cached source files in bytes, not of their parsed JSON, the least
+            recently used files are evicted first.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._documents: OrderedDict[Path, tuple[tuple[int, int], str, Any]] = OrderedDict()
+        # The files are loaded by several threads in `Parser.iter_file`
+        self._lock = threading.Lock()
+
+    def get(self, file: Path) -> tuple[str, Any]:
+        """Get the text and the parsed JSON of a file, loaded if it's not in the cache or if it changed."""
+        stat = file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        path = file.resolve()
+        with self._lock:
+            entry = self._documents.get(path)
+            if entry is not None and entry[0] == signature:
+                self._documents.move_to_end(path)
+                self.hits += 1
+                return entry[1], entry[2]
+            self.misses += 1
+
+        # Loaded without the lock, another thread may load the same file
+        with file.open(encoding="utf-8") as schema_file:
+            text = schema_file.read()
+        document = json.loads(text)
+
+        with self._lock:
+            self._remove(path)
+            if stat.st_size <= self.max_size:
+                self._documents[path] = (signature, text, document)
+                self._size += stat.st_size
+            while self._size > self.max_size:
+                self._remove(next(iter(self._documents)))
+        return text, document
+
+    def _remove(self, path: Path) -> None:
+        entry = self._documents.pop(path, None)
+        if entry is not None:
+            self._size -= entry[0][1]
+
+    def invalidate(self, file: Path | None = None) -> None:
+        """Remove a file from the cache, or all the files."""
+        with self._lock:
+            if file is None:
+                self._documents.clear()
+                self._size = 0
+            else:
+                self._remove(file.resolve())
+
+
+document_cache = DocumentCache()
+
+
+class Loader(ABC):
+    """
+    Loader of the files referenced by a JSON Schema file, used by `Parser.iter_file`.
+
+    The referenced files are named by their path relative to the domain, e.g. `definitions.json`.
+    A loader can be called by several threads at the same time, and it's pickled to the
+    processes that render the files with more than one job.
+    """
+
+    @abstractmethod
+    def location(self, name: str) -> str:
+        """Get the path or the URL of a referenced file."""
+
+    @abstractmethod
+    def load(self, name: str) -> tuple[str, Any]:
+        """Get the text and the parsed JSON of a referenced file, raise `FileNotFoundError` if it doesn't exist."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources of the loader, nothing by default."""
+
+
+class FileLoader(Loader):
+    """Loader of the referenced files from a directory, through the document cache."""
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Initialize the loader.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory of the referenced files, usually the one of the root file.
+        """
+        self.directory = directory
+
+    def location(self, name: str) -> str:
+        """Get the resolved path of a referenced file."""
+        return str((self.directory / name).resolve())
+
+    def load(self, name: str) -> tuple[str, Any]:
+        """Get the text and the parsed JSON of a referenced file."""
+        return document_cache.get(self.directory / name)
+
+
+class HttpLoader(Loader):
+    """
+    Loader of the referenced files from an HTTP server.
+
+    The connections are kept alive and reused, up to `max_connections` per server. With a
+    `cache_directory`, the responses are stored on disk and revalidated with their `ETag`
+    and `Last-Modified` headers, and in `offline` mode the files are only read from the cache.
+
+    Examples
+    --------
+    >>> loader = jsonschema2md.HttpLoader("https://example.com/schemas/", cache_directory=Path(".cache/http"))
+    >>> parser = jsonschema2md.Parser(domain="example.com", loader=loader)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        cache_directory: Path | None = None,
+        offline: bool = False,
+        timeout: float = 30,
+        max_connections: int = 8,
+    ) -> None:
+        """
+        Initialize the loader.
+
+        Parameters
+        ----------
+        base_url : str
+            The URL of the directory of the referenced files, e.g. `https://example.com/schemas/`.
+        cache_directory : Path, default None
+            The directory of the cache of the responses, created if needed.
+        offline : bool, default False
+            If `True`, the files are only read from the cache, a file that isn't in the cache doesn't exist.
+        timeout : float, default 30
+            The timeout of the connections in seconds.
+        max_connections : int, default 8
+            The maximum number of idle connections kept per server.
+        """
+        self.base_url = base_url
+        self.cache_directory = cache_directory
+        self.offline = offline
+        self.timeout = timeout
+        self.max_connections = max_connections
+        # Number of requests, and of responses served from the cache after a revalidation
+        self.requests = 0
+        self.revalidated = 0
+        self._init_connections()
+
+    def _init_connections(self) -> None:
+        self._connections: dict[tuple[str, str], list[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state to pickle, without the connections."""
+        state = self.__dict__.copy()
+        del state["_connections"]
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled loader, without connection."""
+        self.__dict__.update(state)
+        self._init_connections()
+
+    def location(self, name: str) -> str:
+        """Get the URL of a referenced file."""
+        return urljoin(self.base_url, name)
+
+    def load(self, name: str) -> tuple[str, Any]:
+        """Get the text and the parsed JSON of a referenced file, through the cache if any."""
+        url = self.location(name)
+        entry = self._get_cache(url)
+        if self.offline:
+            if entry is None:
+                message = f"{url} is not in the cache."
+                raise FileNotFoundError(message)
+            text = entry["text"]
+        else:
+            headers = {}
+            if entry is not None and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry is not None and entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            status, response_headers, body = self._request(url, headers)
+            if status == http.HTTPStatus.NOT_MODIFIED and entry is not None:
+                with self._lock:
+                    self.revalidated += 1
+                text = entry["text"]
+            elif status in (http.HTTPStatus.NOT_FOUND, http.HTTPStatus.GONE):
+                message = f"{url} doesn't exist."
+                raise FileNotFoundError(message)
+            elif status != http.HTTPStatus.OK:
+                message = f"Unexpected status {status} for {url}."
+                raise OSError(message)
+            else:
+                text = body.decode("utf-8")
+                self._set_cache(
+                    url,
+                    {
+                        "text": text,
+                        "etag": response_headers.get("ETag"),
+                        "last_modified": response_headers.get("Last-Modified"),
+                    },
+                )
+        return text, json.loads(text)
+
+    def _request(self, url: str, headers: Mapping[str, str]) -> tuple[int, "HTTPMessage", bytes]:
+        """Get a URL, following the redirections, on a kept alive connection."""
+        for _redirection in range(_MAX_REDIRECTIONS):
+            split_url = urlsplit(url)
+            path = split_url.path or "/"
+            if split_url.query:
+                path = f"{path}?{split_url.query}"
+
+            response, body = self._send(split_url.scheme, split_url.netloc, path, headers)
+            location = response.getheader("Location")
+            if response.status in _REDIRECTION_STATUSES and location is not None:
+                url = urljoin(url, location)
+                continue
+            return response.status, response.headers, body
+
+        message = f"Too many redirections for {url}."
+        raise OSError(message)
+
+    def _send(
+        self,
+        scheme: str,
+        netloc: str,
+        path: str,
+        headers: Mapping[str, str],
+    ) -> tuple["HTTPResponse", bytes]:
+        """Send a GET request on an idle connection to the server, or on a new one."""
+        import http.client  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        server = (scheme, netloc)
+        with self._lock:
+            idle_connections = self._connections.setdefault(server, [])
+            connection = idle_connections.pop() if idle_connections else None
+
+        response = None
+        if connection is not None:
+            try:
+                response, body = self._get(connection, path, headers)
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed the kept alive connection
+                connection.close()
+        if response is None:
+            connection_class = (
+                http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            )
+            connection = connection_class(netloc, timeout=self.timeout)
+            response, body = self._get(connection, path, headers)
+        assert connection is not None
+
+        with self._lock:
+            if not response.will_close and len(self._connections[server]) < self.max_connections:
+                self._connections[server].append(connection)
+                return response, body
+        connection.close()
+        return response, body
+
+    def _get(
+        self,
+        connection: "HTTPConnection",
+        path: str,
+        headers: Mapping[str, str],
+    ) -> tuple["HTTPResponse", bytes]:
+        # The loader is called by several threads
+        with self._lock:
+            self.requests += 1
+        connection.request("GET", path, headers=dict(headers))
+        response = connection.getresponse()
+        return response, response.read()
+
+    def _cache_path(self, url: str) -> Path | None:
+        if self.cache_directory is None:
+            return None
+        key = hashlib.blake2b(url.encode(), digest_size=20).hexdigest()
+        return self.cache_directory / key[:2] / f"{key}.json"
+
+    def _get_cache(self, url: str) -> dict[str, Any] | None:
+        """Get the cached response of a URL, `None` if it's not in the cache."""
+        path = self._cache_path(url)
+        if path is None:
+            return None
+        try:
+            with path.open(encoding="utf-8") as entry_file:
+                entry: dict[str, Any] = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def _set_cache(self, url: str, entry: dict[str, Any]) -> None:
+        """Store the response of a URL."""
+        path = self._cache_path(url)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written in a temporary file then renamed, for the concurrent readers
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with temporary_path.open("w", encoding="utf-8") as entry_file:
+                json.dump(entry, entry_file)
+            temporary_path.replace(path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        with self._lock:
+            for connections in self._connections.values():
+                for connection in connections:
+                    connection.close()
+            self._connections = {}
+
+
+class _MemoryMap(mmap.mmap):
+    """Memory map of a file, usable as a file object by `zipfile`, that requires `seekable` before Python 3.13."""
+
+    def seekable(self) -> bool:
+        """Get whether the file supports random access."""
+        return True
+
+
+class _ArchiveLoader(Loader):
+    """Loader of the files of an archive, opened on the first load."""
+
+    def __init__(self, archive: Path, directory: str = "") -> None:
+        """
+        Initialize the loader.
+
+        Parameters
+        ----------
+        archive : Path
+            The path of the archive.
+        directory : str, default ""
+            The directory of the referenced files in the archive, usually the one of the root file.
+        """
+        self.archive = archive
+        self.directory = directory
+        self._init_archive()
+
+    def _init_archive(self) -> None:
+        self._lock = threading.Lock()
+        self._mapping: mmap.mmap | None = None
+        self._opened = False
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state to pickle, without the opened archive."""
+        return {"archive": self.archive, "directory": self.directory}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled loader, the archive is opened again on the first load."""
+        self.__dict__.update(state)
+        self._init_archive()
+
+    def _member(self, name: str) -> str:
+        """Get the name of a referenced file in the archive."""
+        return posixpath.normpath(posixpath.join(self.directory, name))
+
+    def location(self, name: str) -> str:
+        """Get the path of a referenced file, through the archive."""
+        return f"{self.archive.resolve()}/{self._member(name)}"
+
+    def load(self, name: str) -> tuple[str, Any]:
+        """Get the text and the parsed JSON of a referenced file."""
+        member = self._member(name)
+        with self._lock:
+            if not self._opened:
+                self._open()
+                self._opened = True
+        text = self._read(member).decode("utf-8")
+        return text, json.loads(text)
+
+    @abstractmethod
+    def _open(self) -> None:
+        """Open the archive, on the first load."""
+
+    @abstractmethod
+    def _read(self, member: str) -> bytes:
+        """Get the content of a file of the archive, raise `FileNotFoundError` if it doesn't exist."""
+
+    def _map(self) -> mmap.mmap | None:
+        """Map the archive in memory, `None` if it's not possible, e.g. for an empty file."""
+        with self.archive.open("rb") as archive_file:
+            try:
+                return _MemoryMap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+
+    def close(self) -> None:
+        """Close the archive."""
+        with self._lock:
+            self._close()
+            if self._mapping is not None:
+                self._mapping.close()
+            self._init_archive()
+
+    def _close(self) -> None:
+        pass
+
+
+class ZipLoader(_ArchiveLoader):
+    """
+    Loader of the referenced files from a zip archive, without extracting it.
+
+    The archive is memory-mapped when possible, and the files are read at the offsets of its
+    central directory.
+
+    Examples
+    --------
+    >>> parser = jsonschema2md.Parser(domain="example.com", loader=jsonschema2md.ZipLoader(Path("schemas.zip")))
+    """
+
+    def _open(self) -> None:
+        import zipfile  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        self._mapping = self._map()
+        # The memory map is a file object with random access
+        archive_file: IO[bytes] | Path = self._mapping if self._mapping is not None else self.archive  # type: ignore[assignment]
+        self._zip_file = zipfile.ZipFile(archive_file)
+
+    def _read(self, member: str) -> bytes:
+        try:
+            # The reads are serialized by the zip file
+            return self._zip_file.read(member)
+        except KeyError:
+            message = f"{member} doesn't exist in {self.archive}."
+            raise FileNotFoundError(message) from None
+
+    def _close(self) -> None:
+        if self._opened:
+            self._zip_file.close()
+
+
+class TarLoader(_ArchiveLoader):
+    """
+    Loader of the referenced files from a tar archive, without extracting it.
+
+    The archive is read once to index its files. The files of an uncompressed archive are then
+    read at their offsets in the memory-mapped archive, the `.json` files of a compressed
+    archive are kept in memory by the index pass, as the compressed stream has no random access.
+
+    Examples
+    --------
+    >>> parser = jsonschema2md.Parser(domain="example.com", loader=jsonschema2md.TarLoader(Path("schemas.tar.gz")))
+    """
+
+    def _open(self) -> None:
+        import tarfile  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._contents: dict[str, bytes] = {}
+        compressed = not self.archive.name.endswith(".tar")
+        with tarfile.open(self.archive) as tar_file:
+            for member in tar_file:
+                if not member.isfile():
+                    continue
+                name = posixpath.normpath(member.name)
+                if compressed:
+                    if not name.endswith(".json"):
+                        # Only the schemas are kept in memory
+                        continue
+                    extracted_file = tar_file.extractfile(member)
+                    assert extracted_file is not None
+                    self._contents[name] = extracted_file.read()
+                else:
+                    self._offsets[name] = (member.offset_data, member.size)
+        if self._offsets:
+            self._mapping = self._map()
+
+    def _read(self, member: str) -> bytes:
+        if member in self._contents:
+            return self._contents[member]
+        if member not in self._offsets:
+            message = f"{member} doesn't exist in {self.archive}."
+            raise FileNotFoundError(message)
+        offset, size = self._offsets[member]
+        if self._mapping is not None:
+            return self._mapping[offset : offset + size]
+        with self.archive.open("rb") as archive_file:
+            archive_file.seek(offset)
+            return archive_file.read(size)
+
+
+def _archive_loader(file: Path) -> tuple[_ArchiveLoader, str] | None:
+    """Get the loader of the archive containing a file, e.g. `schemas.zip/root.json`, with the name of the file in it."""
+    if file.exists():
+        return None
+    for archive in file.parents:
+        if archive.name.endswith(_ZIP_SUFFIXES + _TAR_SUFFIXES) and archive.is_file():
+            directory = file.parent.relative_to(archive).as_posix()
+            loader_class = ZipLoader if archive.name.endswith(_ZIP_SUFFIXES) else TarLoader
+            return loader_class(archive, "" if directory == "." else directory), file.name
+    return None
+
+
+def _directory_entry(document: Any) -> tuple[str | None, str | None]:
+    """Get the title and the description of a JSON Schema document, for the index of a directory."""
+    if not isinstance(document, dict):
+        return None, None
+    return document.get("title"), document.get("description")
+
+
+def _load_schema_file(loader: Loader, name: str) -> tuple[str, Any, float]:
+    """Load a JSON Schema file, with its text, its parsed JSON, and the time it took in seconds."""
+    start = time.perf_counter()
+    text, document = loader.load(name)
+    return text, document, time.perf_counter() - start
+
+
+class RenderCache:
+    """
+    On-disk cache of the rendered Markdown of the schema files, used by `Parser.iter_file`.
+
+    An entry holds the lines of a file and the files it references, it's keyed by a hash of
+    the file content, the parser options, the locale and the package version. The old entries
+    are removed by `evict`, e.g. once all the files are rendered.
+
+    Examples
+    --------
+    >>> parser = jsonschema2md.Parser(render_cache=jsonschema2md.RenderCache(Path(".cache/jsonschema2md")))
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_size: int = 100 * 1024 * 1024,
+        max_age: float = 30 * 24 * 3600,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory of the cache, created if needed.
+        max_size : int, default 100 MiB
+            The maximum size of the entries in bytes, the least recently used entries are evicted first.
+        max_age : float, default 30 days
+            The maximum time in seconds since an entry was last used.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, content: str, options: str) -> str:
+        """Get the key of the entry of a file content rendered with some options."""
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (_get_version(), options, content):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> tuple[list[str], list[str]] | None:
+        """Get the lines and the references of an entry, `None` if it's not in the cache."""
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # Mark the entry as recently used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self.hits += 1
+        return entry["lines"], entry["refs"]
+
+    def set(self, key: str, lines: list[str], refs: list[str]) -> None:
+        """Store the lines and the references of an entry."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written in a temporary file of the thread then renamed, for the concurrent readers and writers
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with temporary_path.open("w", encoding="utf-8") as entry_file:
+                json.dump({"lines": lines, "refs": refs}, entry_file)
+            temporary_path.replace(path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+    def evict(self) -> int:
+        """Remove the entries older than `max_age`, then the least recently used above `max_size`; get the number of removed entries."""
+        now = time.time()
+        removed = 0
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _mtime, entry_size, _path in entries)
+        for _mtime, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+            removed += 1
+        return removed
+
+
 class Parser:
     """
     JSON Schema to Markdown parser.
@@ -154,6 +1434,7 @@ class Parser:
     """
 
     tab_size = 2
+    # The process-wide default locale, the `locale` arguments only apply to the current thread or task
     current_locale: str | None = None
 
     def __init__(
@@ -167,6 +1448,12 @@ class Parser:
         domain: str | None = None,
         relative: bool = True,
         schema_mapping: Mapping[str, str] | None = None,
+        max_depth: int | None = None,
+        fragment_cache_size: int = 1024,
+        inline_refs: int = 0,
+        load_workers: int | None = None,
+        render_cache: RenderCache | None = None,
+        loader: Loader | None = None,
     ) -> None:
         """
         Initialize JSON Schema to Markdown parser.
@@ -192,12 +1479,32 @@ class Parser:
             to skip certain properties or definitions that are not relevant for the
             documentation. The patterns are matched against the full path of the
             property or definition (e.g., `properties/name`, `definitions/Person`).
+            A pattern without any regex special character is a path prefix, the whole
+            matching subtree is skipped.
         domain : str, default None
             The domain that holds local schemas.
         relative : bool, default True
             If set, the reference links will be relative ("./<path>").
         schema_mapping : Mapping[str, str], optional
             A mapping of schema ids (everything up to the first `.`) to markdown file names (with extension).
+        max_depth : int, default None
+            The maximum nesting depth of the subschemas, a `ValueError` is raised when it's exceeded.
+            If `None`, the depth is not limited.
+        fragment_cache_size : int, default 1024
+            The maximum number of rendered fragments kept in the cache, the fragments are shared
+            between the identical subschemas. `0` disables the cache.
+        inline_refs : int, default 0
+            The number of nested levels of local references (e.g. `#/definitions/Person`) that are
+            replaced by the referenced subschema instead of a link. `0` disables the inlining. The
+            referenced subschema is walked again at each place it's inlined, with its anchors.
+        load_workers : int, default None
+            The number of threads that load the referenced files in `parse_file`. If `None`, the
+            default of `concurrent.futures.ThreadPoolExecutor` is used.
+        render_cache : RenderCache, default None
+            The on-disk cache of the rendered files in `parse_file`.
+        loader : Loader, default None
+            The loader of the referenced files in `parse_file`, e.g. an `HttpLoader`. If `None`,
+            the referenced files are loaded from the directory of the root file.
         """
         self.examples_as_yaml = examples_as_yaml
         self.show_deprecated = show_deprecated
@@ -207,8 +1514,32 @@ class Parser:
         self.domain = domain
         self.relative = relative
         self.schema_mapping = schema_mapping or {}
+        self.max_depth = max_depth
+        self.inline_refs = inline_refs
+        self.load_workers = load_workers
+        self.render_cache = render_cache
+        self.loader = loader
+        # Time in seconds to load each file in `parse_file`, by file name
+        self.load_times: dict[str, float] = {}
+        # The references between the files of the last `parse_file`
+        self.dependency_graph = DependencyGraph()
         self.seen_refs: set[str] = set()
         self.parsed_refs: set[str] = set()
+        # The title and the description of the files of the last `iter_directory`, by path
+        self.directory_entries: dict[str, tuple[str | None, str | None]] = {}
+        # The directory of the file rendered by `iter_directory`, for the relative links
+        self._link_directory = ""
+        # The references of the referenced files rendered in a `batch`, by file, locale and error mode
+        self._batch_refs: dict[tuple[str, str | None, bool], set[str]] | None = None
+        # Number of ignored subschemas per pattern
+        self.ignore_pattern_hits = dict.fromkeys(self.ignore_patterns, 0)
+        self._compile_ignore_patterns()
+        self.fragment_cache_size = fragment_cache_size
+        self.fragment_cache_hits = 0
+        self.fragment_cache_misses = 0
+        self._fragment_cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        # The options that change the rendered fragments
+        self._render_options = (self.domain, self.relative, tuple(sorted(self.schema_mapping.items())))
 
         valid_show_examples_options = ["all", "object", "properties"]
         show_examples = show_examples.lower()
@@ -221,8 +1552,87 @@ class Parser:
             )
             raise ValueError(message)
 
+    def _compile_ignore_patterns(self) -> None:
+        """Compile the ignore patterns in a tuple of path prefixes and a combined regex if possible."""
+        prefixes = []
+        regexes = []
+        for pattern in self.ignore_patterns:
+            if _REGEX_SPECIAL_CHARACTERS.search(pattern) is None:
+                prefixes.append(pattern)
+            else:
+                regexes.append(pattern)
+
+        self._ignore_prefixes = tuple(prefixes)
+        self._ignore_regexes = tuple(re.compile(pattern) for pattern in regexes)
+        # Each pattern gets its own named group to know which one matched, this is only possible
+        # when the patterns don't refer to their own groups.
+        self._ignore_groups = {f"_ignore{index}": pattern for index, pattern in enumerate(regexes)}
+        self._ignore_regex = None
+        if regexes and not any(_REGEX_GROUP_REFERENCE.search(pattern) for pattern in regexes):
+            try:
+                self._ignore_regex = re.compile(
+                    "|".join(f"(?P<{group}>{pattern})" for group, pattern in self._ignore_groups.items()),
+                )
+            except re.error:
+                # E.g. with global flags, as `(?i)`, or the same group name in two patterns,
+                # the patterns are matched one after the other
+                pass
+
+    def _ignored_prefix(self, path: str) -> str | None:
+        """
+        Get the literal ignore pattern that the path starts with, `None` if there isn't any.
+
+        The whole subtree of the path is then ignored, without matching the patterns again.
+        """
+        if not self._ignore_prefixes or not path.startswith(self._ignore_prefixes):
+            return None
+        for prefix in self._ignore_prefixes:
+            if path.startswith(prefix):
+                self.ignore_pattern_hits[prefix] += 1
+                return prefix
+        return None
+
+    def _is_ignored(self, path: str) -> bool:
+        """Check if the path matches an ignore pattern."""
+        return self._ignored_prefix(path) is not None or self._is_ignored_regex(path)
+
+    def _is_ignored_regex(self, path: str) -> bool:
+        """Check if the path matches an ignore pattern with regex special characters."""
+        if self._ignore_regex is not None:
+            match = self._ignore_regex.match(path)
+            if match is None:
+                return False
+            assert match.lastgroup is not None
+            self.ignore_pattern_hits[self._ignore_groups[match.lastgroup]] += 1
+            return True
+        for regex in self._ignore_regexes:
+            if regex.match(path) is not None:
+                self.ignore_pattern_hits[regex.pattern] += 1
+                return True
+        return False
+
+    def _get_ref_link(self, ref: str) -> str:
+        """Get the link to a reference, the referenced files of the domain are added to `seen_refs`."""
+        url = urlsplit(ref)
+        if url.fragment and not url.path:
+            return f"#{quote(url.fragment[1:])}"
+        if self.domain and (url.netloc == self.domain or url.path.startswith(self.domain)):
+            ref_name, ext = normalize_file_name(self.domain, url.path)
+            file_name = self.schema_mapping.get(ref_name, f"{ref_name}.md")
+            self.seen_refs.add(f"{ref_name}{ext}")
+            if self.relative:
+                if self._link_directory:
+                    # The link is relative to the directory of the rendered file
+                    file_name = posixpath.relpath(file_name, self._link_directory)
+                    if file_name.startswith("../"):
+                        return f"{quote(file_name)}#{quote(url.fragment)}"
+                return f"./{quote(file_name)}#{quote(url.fragment)}"
+            return f"{url.scheme}://{self.domain}/{quote(file_name)}#{quote(url.fragment)}"
+        return f"{url.scheme}://{url.netloc}/{quote(url.path)}#{quote(url.fragment)}"
+
     def _construct_description_line(self, obj: dict[str, Any], add_type: bool = False) -> Sequence[str]:
         """Construct description line of property, definition, or item."""
+        _ = _get_messages()
         description_line = []
 
         if "description" in obj:
@@ -352,21 +1762,9 @@ class Parser:
                 description_line.append(_("Cannot contain unevaluated properties."))
 
         if "$ref" in obj:
-            url = urlsplit(obj["$ref"])
-            if url.fragment and not url.path:
-                ref_link = f"#{quote(url.fragment[1:])}"
-            elif self.domain and (url.netloc == self.domain or url.path.startswith(self.domain)):
-                ref_name, ext = normalize_file_name(self.domain, url.path)
-                file_name = self.schema_mapping.get(ref_name, f"{ref_name}.md")
-                self.seen_refs.add(f"{ref_name}{ext}")
-                if self.relative:
-                    ref_link = f"./{quote(file_name)}#{quote(url.fragment)}"
-                else:
-                    ref_link = f"{url.scheme}://{self.domain}/{quote(file_name)}#{quote(url.fragment)}"
-            else:
-                ref_link = f"{url.scheme}://{url.netloc}/{quote(url.path)}#{quote(url.fragment)}"
             description_line.append(
-                _("Refer to *[%(ref)s](%(ref_link)s)*.") % {"ref": obj["$ref"], "ref_link": ref_link},
+                _("Refer to *[%(ref)s](%(ref_link)s)*.")
+                % {"ref": obj["$ref"], "ref_link": self._get_ref_link(obj["$ref"])},
             )
         if "default" in obj:
             description_line.append(_("Default: `%(default)s`.") % {"default": json.dumps(obj["default"])})
@@ -377,17 +1775,122 @@ class Parser:
 
         return description_line
 
-    def _construct_examples(
+    def _get_description_content(self, node: SchemaNode) -> str:
+        """Get the type, attributes, and description of a subschema, from the fragment cache if possible."""
+        named = node.name is not None
+        if self.fragment_cache_size <= 0:
+            return self._construct_description_content(
+                node.schema,
+                node.indent_level,
+                named,
+                node.required,
+                node.dependent_required,
+            )
+
+        key = (
+            _fragment_key(node.schema),
+            node.indent_level,
+            named,
+            named and node.required,
+            node.dependent_required if named else (),
+            _get_locale(),
+            self._render_options,
+            self._link_directory,
+        )
+        fragment = self._fragment_cache.get(key)
+        if fragment is not None:
+            self._fragment_cache.move_to_end(key)
+            self.fragment_cache_hits += 1
+            return fragment
+
+        self.fragment_cache_misses += 1
+        fragment = self._construct_description_content(
+            node.schema,
+            node.indent_level,
+            named,
+            node.required,
+            node.dependent_required,
+        )
+        self._fragment_cache[key] = fragment
+        if len(self._fragment_cache) > self.fragment_cache_size:
+            self._fragment_cache.popitem(last=False)
+        return fragment
+
+    def _construct_description_content(
         self,
         obj: dict[str, Any],
-        indent_level: int = 0,
-        add_header: bool = True,
-    ) -> Sequence[str]:
+        indent_level: int,
+        named: bool,
+        required: bool,
+        dependent_required: Sequence[str] | None,
+    ) -> str:
+        """Construct the type, attributes, and description of a subschema."""
+        _ = _get_messages()
+        description_line_base = self._construct_description_line(obj)
+        description_line_list = [
+            line.replace("\n\n", "<br>" + " " * self.tab_size * (indent_level + 1))
+            for line in description_line_base
+        ]
+        description_line = " ".join(description_line_list)
+
+        obj_attributes = []
+        formatted_type = ""
+
+        if "type" in obj:
+            formatted_type = _maybe_list(obj["type"], style="or", mapper=_.types.__getitem__)
+
+        # TL: I'm looking to always have a comma between (type or format) and attributes,
+        # so I'm adding them manually.
+        optional_format = _(", format: %(format)s") % {"format": obj["format"]} if "format" in obj else ""
+        if not named:
+            obj_type = f"*{formatted_type}{optional_format}*" if "type" in obj else ""
+        else:
+            obj_attributes.append(_("required") if required else "")
+            if dependent_required and not required:
+                dependent_required_code = _format_list(
+                    [f"`{k}`" for k in dependent_required],
+                    style="or",
+                )
+                obj_attributes.append(
+                    _("required <sub><sup>if %(dependent)s is set</sup></sub>")
+                    % {"dependent": dependent_required_code},
+                )
+
+            obj_attributes.extend(
+                (
+                    _("deprecated") if obj.get("deprecated") else "",
+                    _("read-only") if obj.get("readOnly") else "",
+                    _("write-only") if obj.get("writeOnly") else "",
+                ),
+            )
+
+            attributes = (
+                _(", %(attributes)s") % {"attributes": _format_list(obj_attributes)}
+                if any(obj_attributes)
+                else ""
+            )
+
+            obj_type = ""
+            if "type" in obj:
+                obj_type = f" *({formatted_type}{optional_format}{attributes})*"
+            elif "$ref" in obj and any(obj_attributes):
+                obj_type = f" *({_format_list(obj_attributes)})*"
+
+        return obj_type + description_line.strip()
+
+    def _construct_examples(
+        self,
+        obj: dict[str, Any],
+        indent_level: int = 0,
+        add_header: bool = True,
+    ) -> Sequence[str]:
         def dump_json_with_line_head(obj: dict[str, Any], line_head: str, **kwargs: Any) -> str:
             result = [line_head + line for line in io.StringIO(json.dumps(obj, **kwargs)).readlines()]
             return "".join(result)
 
         def dump_yaml_with_line_head(obj: dict[str, Any], line_head: str, **kwargs: Any) -> str:
+            import yaml  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
             result = [
                 line_head + line
                 for line in io.StringIO(yaml.dump(obj, sort_keys=False, **kwargs)).readlines()
@@ -412,6 +1915,36 @@ class Parser:
                 )
         return example_lines
 
+    def _inline_ref(
+        self,
+        obj: dict[str, Any],
+        index: SchemaIndex,
+        inline_chain: tuple[str, ...],
+    ) -> tuple[dict[str, Any], tuple[str, ...]]:
+        """
+        Replace a local reference by the referenced subschema.
+
+        The references that point outside of the document, can't be resolved, or are circular
+        are kept as they are.
+        """
+        first_resolution = obj["$ref"] not in index.errors
+        try:
+            resolved = index.resolve(obj["$ref"])
+        except ValueError as error:
+            if first_resolution:
+                print(f"WARN: {error}")
+            return obj, inline_chain
+        if resolved is None:
+            return obj, inline_chain
+
+        pointer, target = resolved
+        if pointer in inline_chain or not isinstance(target, dict):
+            return obj, inline_chain
+        if len(obj) > 1:
+            # The keywords next to the reference take precedence
+            target = {**target, **{key: value for key, value in obj.items() if key != "$ref"}}
+        return target, (*inline_chain, pointer)
+
     def _parse_object(
         self,
         obj: dict[str, Any] | list[Any],
@@ -423,220 +1956,375 @@ class Parser:
         required: bool = False,
         dependent_required: list[str] | None = None,
     ) -> list[str]:
-        """Parse JSON object and its items, definitions, and properties recursively."""
+        """Parse JSON object and its items, definitions, and properties."""
         if not output_lines:
             output_lines = []
 
-        indentation = " " * self.tab_size * indent_level
-        indentation_items = " " * self.tab_size * (indent_level + 1)
-
-        if isinstance(obj, list):
-            output_lines.append(f"{indentation}- **{name}**:\n")
-
-            for i, element in enumerate(obj):
-                output_lines = self._parse_object(
-                    element,
-                    path=[*path, str(i)],
-                    name=None,
-                    name_monospace=False,
-                    output_lines=output_lines,
-                    indent_level=indent_level + 2,
-                )
-            return output_lines
-
-        if not isinstance(obj, dict):
-            message = f"Non-object type found in properties list: `{name}: {obj}`."
-            raise TypeError(message)
-
-        # If the schema contains a single allOf, anyOf, or oneOf schema,
-        # we can lift that schema to the top level if no other properties conflicted.
-        # This is particularly useful when the JSON Schema was generated by a tool
-        # that outputs this format, e.g. Zod 4.
-        schema_composition_keywords = ["allOf", "anyOf", "oneOf"]
-        matching_data_len = sum(len(obj.get(k, [])) for k in schema_composition_keywords)
-        if matching_data_len == 1:
-            for keyword in schema_composition_keywords:
-                if keyword in obj:
-                    subschema = obj[keyword][0]
-                    # Check that no properties conflict with the base object
-                    has_subschema_conflict = any(k in subschema and subschema[k] != v for k, v in obj.items())
-                    if not has_subschema_conflict:
-                        obj = {**subschema, **obj}
-                        del obj[keyword]
-                        break
-
-        # Construct full description line
-        description_line_base = self._construct_description_line(obj)
-        description_line_list = [
-            line.replace("\n\n", "<br>" + indentation_items) for line in description_line_base
-        ]
+        output_lines.extend(
+            self.render_ir(
+                self._build_object(
+                    obj,
+                    name,
+                    path,
+                    name_monospace=name_monospace,
+                    indent_level=indent_level,
+                    required=required,
+                    dependent_required=dependent_required,
+                ),
+            ),
+        )
+        return output_lines
 
-        # Add full line to output
-        description_line = " ".join(description_line_list)
-        obj_attributes = []
-        formatted_type = ""
+    def _build_object(
+        self,
+        obj: dict[str, Any] | list[Any],
+        name: str | None,
+        path: list[str],
+        name_monospace: bool = True,
+        indent_level: int = 0,
+        required: bool = False,
+        dependent_required: Sequence[str] | None = None,
+        index: SchemaIndex | None = None,
+        keyword_name: bool = False,
+    ) -> Iterator[SchemaRecord]:
+        """
+        Build the records of a JSON object and its items, definitions, and properties.
 
-        if "type" in obj:
-            formatted_type = _maybe_list(obj["type"], style="or", mapper=lambda x: str(TYPES[x]))
+        The subschemas are walked with an explicit work stack instead of recursion, so the
+        nesting depth is only limited by `max_depth`.
 
-        # TL: I'm looking to always have a comma between (type or format) and attributes,
-        # so I'm adding them manually.
-        optional_format = _(", format: %(format)s") % {"format": obj["format"]} if "format" in obj else ""
-        if name is None:
-            obj_type = f"*{formatted_type}{optional_format}*" if "type" in obj else ""
-            name_formatted = ""
-        else:
-            obj_attributes.append(_("required") if required else "")
-            if dependent_required and not required:
-                dependent_required_code = _format_list([f"`{k}`" for k in dependent_required], style="or")
-                obj_attributes.append(
-                    _("required <sub><sup>if %(dependent)s is set</sup></sub>")
-                    % {"dependent": dependent_required_code},
-                )
-
-            obj_attributes.extend(
-                (
-                    _("deprecated") if obj.get("deprecated") else "",
-                    _("read-only") if obj.get("readOnly") else "",
-                    _("write-only") if obj.get("writeOnly") else "",
-                ),
+        With an `index` of the document, the local references are inlined up to `inline_refs`
+        nested levels.
+        """
+        # The stack holds the work still to do, the last task being the next one:
+        # a subschema to walk or a record to output.
+        stack: list[tuple[Any, ...]] = [
+            (
+                _TASK_NODE,
+                obj,
+                name,
+                keyword_name,
+                "/".join(path),
+                len(path),
+                name_monospace,
+                indent_level,
+                required,
+                tuple(dependent_required or ()),
+                0,
+                (),
+                None,
+            ),
+        ]
+        while stack:
+            task = stack.pop()
+
+            if task[0] == _TASK_RECORD:
+                yield task[1]
+                continue
+
+            (
+                _task,
+                obj,
+                name,
+                keyword_name,
+                path_str,
+                path_len,
+                name_monospace,
+                indent_level,
+                required,
+                node_dependent_required,
+                depth,
+                inline_chain,
+                # The literal ignore pattern of an ignored ancestor, the whole subtree is ignored
+                ignored_prefix,
+            ) = task
+
+            if self.max_depth is not None and depth > self.max_depth:
+                message = f"Maximum schema depth of {self.max_depth} exceeded at `{path_str}`."
+                raise ValueError(message)
+
+            path_prefix = f"{path_str}/" if path_len else ""
+            # Tasks for the subschemas, in output order
+            children: list[tuple[Any, ...]] = []
+
+            if isinstance(obj, list):
+                yield ListNode(indent_level, name, keyword_name)
+
+                for i, element in enumerate(obj):
+                    children.append(
+                        (
+                            _TASK_NODE,
+                            element,
+                            None,
+                            False,
+                            f"{path_prefix}{i}",
+                            path_len + 1,
+                            False,
+                            indent_level + 2,
+                            False,
+                            (),
+                            depth + 1,
+                            inline_chain,
+                            ignored_prefix,
+                        ),
+                    )
+                stack.extend(reversed(children))
+                continue
+
+            if not isinstance(obj, dict):
+                display_name = _KEYWORD_NAMES[name] if keyword_name else name
+                message = f"Non-object type found in properties list: `{display_name}: {obj}`."
+                raise TypeError(message)
+
+            if index is not None and "$ref" in obj and len(inline_chain) < self.inline_refs:
+                obj, inline_chain = self._inline_ref(obj, index, inline_chain)
+
+            # If the schema contains a single allOf, anyOf, or oneOf schema,
+            # we can lift that schema to the top level if no other properties conflicted.
+            # This is particularly useful when the JSON Schema was generated by a tool
+            # that outputs this format, e.g. Zod 4.
+            schema_composition_keywords = ["allOf", "anyOf", "oneOf"]
+            matching_data_len = sum(len(obj.get(k, [])) for k in schema_composition_keywords)
+            if matching_data_len == 1:
+                for keyword in schema_composition_keywords:
+                    if keyword in obj:
+                        subschema = obj[keyword][0]
+                        # Check that no properties conflict with the base object
+                        has_subschema_conflict = any(
+                            k in subschema and subschema[k] != v for k, v in obj.items()
+                        )
+                        if not has_subschema_conflict:
+                            obj = {**subschema, **obj}
+                            del obj[keyword]
+                            break
+
+            if "$ref" in obj:
+                # Register the referenced file, also for the deprecated and ignored subschemas
+                self._get_ref_link(obj["$ref"])
+
+            has_collapsible_children = any(
+                prop in obj and isinstance(obj[prop], dict) and len(obj[prop]) > 0
+                for prop in [
+                    "additionalProperties",
+                    "unevaluatedProperties",
+                    "properties",
+                    "patternProperties",
+                ]
             )
 
-            attributes = (
-                _(", %(attributes)s") % {"attributes": _format_list(obj_attributes)}
-                if any(obj_attributes)
-                else ""
+            has_children = has_collapsible_children or any(
+                prop in obj
+                for prop in ["items", "contains", "definitions", "$defs", "anyOf", "oneOf", "allOf"]
             )
 
-            obj_type = ""
-            if "type" in obj:
-                obj_type = f" *({formatted_type}{optional_format}{attributes})*"
-            elif "$ref" in obj and any(obj_attributes):
-                obj_type = f" *({_format_list(obj_attributes)})*"
-
-            name_formatted = f"**`{name}`**" if name_monospace else f"**{name}**"
-
-        has_collapsible_children = any(
-            prop in obj and isinstance(obj[prop], dict) and len(obj[prop]) > 0
-            for prop in [
-                "additionalProperties",
-                "unevaluatedProperties",
-                "properties",
-                "patternProperties",
-            ]
-        )
-
-        has_children = has_collapsible_children or any(
-            prop in obj for prop in ["items", "contains", "definitions", "$defs", "anyOf", "oneOf", "allOf"]
-        )
-
-        anchor = f'<a id="{quote("/".join(path))}"></a>'
-        ignored = any(re.match(ignore, "/".join(path)) is not None for ignore in self.ignore_patterns)
-        if obj.get("deprecated") and not self.show_deprecated:
-            # Don't even parse children of deprecated properties
-            return output_lines
-
-        # In some cases, this description is empty and provides no information,
-        # e.g. for `items: {}` or `additionalProperties: {}`.
-        # If the description is empty, don't add it.
-        description_content = obj_type + description_line.strip()
-        show_description = len(description_content) > 0 or has_children
-
-        if not ignored and show_description:
-            if has_collapsible_children and self.collapse_children:
-                # Expandable children
-                output_lines.extend(
-                    [
-                        f"{indentation}- <details>",
-                        "<summary>",
-                        markdown.markdown(  # Only HTML is supported for the summary
-                            f"{anchor}{name_formatted}{description_content}",
-                        )[3:-4],  # Remove <p> tags
-                        "</summary>\n\n",
-                    ],
-                )
-
+            if ignored_prefix is None:
+                ignored_prefix = self._ignored_prefix(path_str)
             else:
-                output_lines.append(
-                    f"{indentation}- {anchor}{name_formatted}{description_content}\n",
-                )
+                self.ignore_pattern_hits[ignored_prefix] += 1
+            ignored = ignored_prefix is not None or self._is_ignored_regex(path_str)
+            if obj.get("deprecated") and not self.show_deprecated:
+                # Don't even parse children of deprecated properties
+                continue
+
+            yield SchemaNode(
+                indent_level,
+                path_str,
+                name,
+                keyword_name,
+                name_monospace,
+                required,
+                node_dependent_required,
+                _description_schema(obj),
+                ignored,
+                has_children,
+                has_collapsible_children,
+            )
 
-        # Recursively parse subschemas following schema composition keywords
-        schema_composition_keyword_map = {
-            "allOf": _("All of"),
-            "anyOf": _("Any of"),
-            "oneOf": _("One of"),
-        }
-        for key, label in schema_composition_keyword_map.items():
-            if key in obj:
-                # Only add if the subschema is not ignored
-                ignored_child = any(
-                    re.match(ignore, "/".join([*path, key])) is not None for ignore in self.ignore_patterns
-                )
-                if not ignored_child:
-                    output_lines.append(
-                        f"{indentation_items}- **{label}**\n",
+            # Parse subschemas following schema composition keywords
+            for key in _COMPOSITION_LABELS:
+                if key in obj:
+                    # Only add if the subschema is not ignored
+                    if ignored_prefix is None:
+                        ignored_child = self._is_ignored(f"{path_prefix}{key}")
+                    else:
+                        ignored_child = True
+                        self.ignore_pattern_hits[ignored_prefix] += 1
+                    if not ignored_child:
+                        children.append((_TASK_RECORD, CompositionLabel(indent_level + 1, key)))
+                    for i, child_obj in enumerate(obj[key]):
+                        children.append(
+                            (
+                                _TASK_NODE,
+                                child_obj,
+                                None,
+                                False,
+                                f"{path_prefix}{key}/{i}",
+                                path_len + 2,
+                                False,
+                                indent_level + 2,
+                                False,
+                                (),
+                                depth + 1,
+                                inline_chain,
+                                ignored_prefix,
+                            ),
+                        )
+
+            # Add items and definitions
+            children.extend(
+                [
+                    (
+                        _TASK_NODE,
+                        obj[property_name],
+                        property_name,
+                        True,
+                        f"{path_prefix}{property_name}",
+                        path_len + 1,
+                        False,
+                        indent_level + 1,
+                        False,
+                        (),
+                        depth + 1,
+                        inline_chain,
+                        ignored_prefix,
                     )
-                for i, child_obj in enumerate(obj[key]):
-                    output_lines = self._parse_object(
-                        child_obj,
-                        path=[*path, key, str(i)],
-                        name=None,
-                        name_monospace=False,
-                        output_lines=output_lines,
-                        indent_level=indent_level + 2,
+                    for property_name in ["items", "contains", "definitions", "$defs"]
+                    if property_name in obj
+                ],
+            )
+
+            # Add additional child properties
+            children.extend(
+                [
+                    (
+                        _TASK_NODE,
+                        obj[property_name],
+                        property_name,
+                        True,
+                        f"{path_prefix}{property_name}",
+                        path_len + 1,
+                        False,
+                        indent_level + 1,
+                        False,
+                        (),
+                        depth + 1,
+                        inline_chain,
+                        ignored_prefix,
                     )
+                    for property_name in ["additionalProperties", "unevaluatedProperties"]
+                    if property_name in obj and isinstance(obj[property_name], dict)
+                ],
+            )
 
-        # Recursively add items and definitions
-        for property_name in ["items", "contains", "definitions", "$defs"]:
-            if property_name in obj:
-                output_lines = self._parse_object(
-                    obj[property_name],
-                    path=[*path, property_name],
-                    name=str(PROPERTY_NAMES[property_name]),
-                    name_monospace=False,
-                    output_lines=output_lines,
-                    indent_level=indent_level + 1,
-                )
+            # Add child properties
+            required_properties = obj.get("required", [])
+            dependent_required_map = obj.get("dependentRequired", {})
+            for property_name in ["properties", "patternProperties"]:
+                if property_name in obj:
+                    for obj_property_name, property_obj in obj[property_name].items():
+                        children.append(
+                            (
+                                _TASK_NODE,
+                                property_obj,
+                                obj_property_name,
+                                False,
+                                f"{path_prefix}{property_name}/{obj_property_name}",
+                                path_len + 2,
+                                True,
+                                indent_level + 1,
+                                obj_property_name in required_properties,
+                                tuple(k for k, v in dependent_required_map.items() if obj_property_name in v),
+                                depth + 1,
+                                inline_chain,
+                                ignored_prefix,
+                            ),
+                        )
+
+            children.append(
+                (
+                    _TASK_RECORD,
+                    SchemaNodeEnd(
+                        indent_level,
+                        obj.get("examples"),
+                        not ignored and has_collapsible_children,
+                    ),
+                ),
+            )
+            stack.extend(reversed(children))
+
+    def _render_record(self, record: SchemaRecord) -> Iterator[str]:
+        """Render a record of the intermediate representation to Markdown lines."""
+        _ = _get_messages()
+        if isinstance(record, SchemaNode):
+            if record.ignored:
+                # Only walked for its references and examples
+                return
+            name_formatted = ""
+            if record.name is not None:
+                name = _.keyword_names[record.name] if record.keyword_name else record.name
+                name_formatted = f"**`{name}`**" if record.name_monospace else f"**{name}**"
+            description_content = self._get_description_content(record)
+
+            # In some cases, this description is empty and provides no information,
+            # e.g. for `items: {}` or `additionalProperties: {}`.
+            # If the description is empty, don't add it.
+            show_description = len(description_content) > 0 or record.has_children
+
+            if show_description:
+                indentation = " " * self.tab_size * record.indent_level
+                anchor = f'<a id="{quote(record.path)}"></a>'
+                if record.has_collapsible_children and self.collapse_children:
+                    # Expandable children
+                    import markdown  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+                    yield f"{indentation}- <details>"
+                    yield "<summary>"
+                    yield markdown.markdown(  # Only HTML is supported for the summary
+                        f"{anchor}{name_formatted}{description_content}",
+                    )[3:-4]  # Remove <p> tags
+                    yield "</summary>\n\n"
 
-        # Recursively add additional child properties
-        for extra_props in ["additional", "unevaluated"]:
-            property_name = f"{extra_props}Properties"
-            if property_name in obj and isinstance(obj[property_name], dict):
-                output_lines = self._parse_object(
-                    obj[property_name],
-                    path=[*path, property_name],
-                    name=_("Additional properties")
-                    if extra_props == "additional"
-                    else _("Unevaluated properties"),
-                    name_monospace=False,
-                    output_lines=output_lines,
-                    indent_level=indent_level + 1,
+                else:
+                    yield f"{indentation}- {anchor}{name_formatted}{description_content}\n"
+
+        elif isinstance(record, SchemaNodeEnd):
+            if record.collapsible and self.collapse_children:
+                yield f"\n{' ' * self.tab_size * (record.indent_level + 1)}</details>\n\n"
+            # Add examples
+            if record.examples is not None and self.show_examples in ["all", "properties"]:
+                yield from self._construct_examples(
+                    {"examples": record.examples},
+                    indent_level=record.indent_level,
                 )
 
-        # Recursively add child properties
-        for property_name in ["properties", "patternProperties"]:
-            if property_name in obj:
-                for obj_property_name, property_obj in obj[property_name].items():
-                    output_lines = self._parse_object(
-                        property_obj,
-                        path=[*path, property_name, obj_property_name],
-                        name=obj_property_name,
-                        output_lines=output_lines,
-                        indent_level=indent_level + 1,
-                        required=obj_property_name in obj.get("required", []),
-                        dependent_required=[
-                            k for k, v in obj.get("dependentRequired", {}).items() if obj_property_name in v
-                        ],
-                    )
-
-        if not ignored and has_collapsible_children and self.collapse_children and show_description:
-            output_lines.append(f"\n{indentation_items}</details>\n\n")
-        # Add examples
-        if self.show_examples in ["all", "properties"]:
-            output_lines.extend(self._construct_examples(obj, indent_level=indent_level))
-
-        return output_lines
+        elif isinstance(record, CompositionLabel):
+            indentation = " " * self.tab_size * record.indent_level
+            yield f"{indentation}- **{_.composition_labels[record.keyword]}**\n"
+
+        elif isinstance(record, ListNode):
+            indentation = " " * self.tab_size * record.indent_level
+            list_name = record.name
+            if record.keyword_name and list_name is not None:
+                list_name = _.keyword_names[list_name]
+            yield f"{indentation}- **{list_name}**:\n"
+
+        elif isinstance(record, SectionHeader):
+            yield f"#{'#' * (self.header_level + 1)} {_.section_titles[record.keyword]}\n\n"
+
+        elif isinstance(record, DocumentHeader):
+            title = _("JSON Schema") if record.title is None else record.title
+            yield f"{'#' * (self.header_level + 1)} {title}\n\n"
+            if record.description is not None:
+                yield f"*{record.description}*\n\n"
+
+        elif isinstance(record, DocumentExamples):
+            if self.show_examples in ["all", "object"]:
+                yield f"#{'#' * (self.header_level + 1)} {_('Examples')}\n\n"
+                yield from self._construct_examples(
+                    {"examples": record.examples},
+                    indent_level=0,
+                    add_header=False,
+                )
 
     def parse_file(
         self,
@@ -644,6 +2332,7 @@ class Parser:
         fail_on_error_in_defs: bool = True,
         ref_depth: int = 10,
         locale: str | None = None,
+        jobs: int = 1,
     ) -> dict[str, Sequence[str]]:
         """
         Parse JSON Schema file and its references to Markdown text.
@@ -660,6 +2349,8 @@ class Parser:
             The maximum depth to follow references.
         locale: Optional[str]
             The locale to use for translations. If None, the default locale will be used.
+        jobs : int, default 1
+            The number of processes that render the referenced files.
 
         Returns
         -------
@@ -667,48 +2358,527 @@ class Parser:
             A dictionary where keys are file names (without `.json` extension) and values are lists of strings
             representing the parsed Markdown documentation for each file.
         """
-        if locale is not None:
-            Parser.current_locale = negotiate_locale((locale,), get_locales())
+        return {
+            name: list(lines)
+            for name, lines in self.iter_file(file, fail_on_error_in_defs, ref_depth, locale, jobs)
+        }
+
+    def parse_file_locales(
+        self,
+        file: Path,
+        locales: Sequence[str],
+        fail_on_error_in_defs: bool = True,
+        ref_depth: int = 10,
+        jobs: int = 1,
+    ) -> dict[str, dict[str, Sequence[str]]]:
+        """
+        Parse JSON Schema file and its references to Markdown text in several locales.
 
-        with file.open(encoding="utf-8") as input_file:
-            schema_obj = json.load(input_file)
+        The files are loaded, and their intermediate representation is built, once, as in
+        `iter_file`; then it is rendered in each locale. With more than one job, the locales are
+        rendered in parallel by `jobs` processes.
 
-        root = self.parse_schema(schema_obj, fail_on_error_in_defs)
+        Parameters
+        ----------
+        file: Path
+            The Path to the JSON Schema file to parse.
+        locales: Sequence[str]
+            The locales to use for translations.
+        fail_on_error_in_defs: bool
+            If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schemas. If False, the method will attempt to continue parsing
+            despite such errors.
+        ref_depth : int, default 10
+            The maximum depth to follow references.
+        jobs : int, default 1
+            The number of processes that build the referenced files, then render the locales.
 
-        root_name = normalize_file_name(self.domain or "", file.name)[0]
-        parsed_files = {root_name: root}
+        Returns
+        -------
+        dict[str, dict[str, Sequence[str]]]
+            For each locale, a dictionary where keys are file names (without `.json` extension) and values
+            are lists of strings representing the parsed Markdown documentation for each file.
+        """
+        self.load_times = {}
+        self.dependency_graph = DependencyGraph()
+        try:
+            files_ir = {
+                name: tuple(records)
+                for name, records in self._iter_graph_files(
+                    file,
+                    None,
+                    fail_on_error_in_defs,
+                    ref_depth,
+                    jobs,
+                    build_ir=True,
+                )
+            }
+        finally:
+            self.seen_refs = set()
+            self.parsed_refs = set()
+
+        if jobs > 1 and len(locales) > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(jobs, len(locales)),
+                initializer=_init_render_worker,
+                initargs=(self, None),
+            ) as executor:
+                tasks = [
+                    executor.submit(_render_locale_files, files_ir, locale, fail_on_error_in_defs)
+                    for locale in locales
+                ]
+                return {locale: task.result() for locale, task in zip(locales, tasks, strict=True)}
+        return {
+            locale: {
+                name: list(self.render_ir(schema_ir, fail_on_error_in_defs, locale))
+                for name, schema_ir in files_ir.items()
+            }
+            for locale in locales
+        }
 
-        if self.domain:
-            for _ in range(ref_depth):
-                to_parse = self.seen_refs - self.parsed_refs
-                if not to_parse:
-                    break
+    def iter_file(
+        self,
+        file: Path,
+        fail_on_error_in_defs: bool = True,
+        ref_depth: int = 10,
+        locale: str | None = None,
+        jobs: int = 1,
+    ) -> Iterator[tuple[str, Iterator[str]]]:
+        """
+        Parse JSON Schema file and its references to Markdown text, yielding the lines as they are rendered.
+
+        The references are discovered while a file is rendered, so the lines of a file are consumed
+        before the next file is parsed; the remaining lines are discarded if needed.
+
+        The referenced files are rendered by increasing depth, the depth of a file being the length
+        of its shortest reference path from the root file, up to `ref_depth`. The references
+        between the files are available in `dependency_graph`.
 
-                for ref in to_parse:
-                    ref_file = file.parent / ref
+        The files of a depth are loaded by the `loader` in parallel, by `load_workers` threads, then they are
+        rendered one after the other, sorted by name. With more than one job, the files of a depth
+        are loaded and rendered by `jobs` processes instead, and their references are collected
+        from the processes. The load time of each file is available in `load_times`.
 
-                    if not ref_file.exists():
-                        print(f'WARN: Referenced file "{ref}" does not exist, skipping.')
+        Parameters
+        ----------
+        file: Path
+            The Path to the JSON Schema file to parse.
+        fail_on_error_in_defs: bool
+            If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schemas. If False, the method will attempt to continue parsing
+            despite such errors.
+        ref_depth : int, default 10
+            The maximum depth to follow references.
+        locale: Optional[str]
+            The locale to use for translations. If None, the default locale will be used.
+        jobs : int, default 1
+            The number of processes that render the referenced files.
+
+        Yields
+        ------
+        tuple[str, Iterator[str]]
+            The file name (without `.json` extension) and an iterator over the lines of the
+            Markdown documentation of the file.
+        """
+        self.load_times = {}
+        self.dependency_graph = DependencyGraph()
+        try:
+            with _use_locale(locale):
+                yield from self._iter_graph_files(file, None, fail_on_error_in_defs, ref_depth, jobs)
+        finally:
+            self.seen_refs = set()
+            self.parsed_refs = set()
+
+    def iter_changed_files(
+        self,
+        file: Path,
+        changed_files: Iterable[str],
+        dependency_graph: DependencyGraph,
+        fail_on_error_in_defs: bool = True,
+        ref_depth: int = 10,
+        locale: str | None = None,
+        jobs: int = 1,
+    ) -> Iterator[tuple[str, Iterator[str]]]:
+        """
+        Parse the changed files of a previous `parse_file` to Markdown text, yielding the lines as they are rendered.
+
+        The rendered Markdown of a file only depends on its own content, so only the changed files
+        of the `dependency_graph` of the previous run are rendered again, then the files they
+        newly reference. The `dependency_graph` is updated with the new references.
+
+        Parameters
+        ----------
+        file: Path
+            The Path to the root JSON Schema file of the previous run.
+        changed_files: Iterable[str]
+            The changed files, relative to the directory of the root file (e.g. `definitions.json`).
+        dependency_graph: DependencyGraph
+            The dependency graph of the previous run, see `DependencyGraph.from_json`.
+        fail_on_error_in_defs: bool
+            If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schemas. If False, the method will attempt to continue parsing
+            despite such errors.
+        ref_depth : int, default 10
+            The maximum depth to follow references.
+        locale: Optional[str]
+            The locale to use for translations. If None, the default locale will be used.
+        jobs : int, default 1
+            The number of processes that render the referenced files.
+
+        Yields
+        ------
+        tuple[str, Iterator[str]]
+            The file name (without `.json` extension) and an iterator over the lines of the
+            Markdown documentation of the file.
+        """
+        self.load_times = {}
+        self.dependency_graph = dependency_graph
+        try:
+            with _use_locale(locale):
+                yield from self._iter_graph_files(
+                    file,
+                    {name for name in changed_files if name in dependency_graph.depths},
+                    fail_on_error_in_defs,
+                    ref_depth,
+                    jobs,
+                )
+        finally:
+            self.seen_refs = set()
+            self.parsed_refs = set()
+
+    def _iter_graph_files(
+        self,
+        file: Path,
+        pending: set[str] | None,
+        fail_on_error_in_defs: bool,
+        ref_depth: int,
+        jobs: int,
+        build_ir: bool = False,
+    ) -> Iterator[tuple[str, Iterator[Any]]]:
+        """
+        Render the files of the dependency graph, and the files they reference.
+
+        With `pending`, only these files are rendered, then the new files they reference;
+        otherwise all the files are rendered, starting with the root one. With `build_ir`, the
+        records of the intermediate representation of the files are yielded instead of their lines.
+        """
+        graph = self.dependency_graph
+        # A file in an archive, e.g. `schemas.zip/root.json`, is loaded from the archive
+        archive = _archive_loader(file)
+        root_loader = FileLoader(file.parent) if archive is None else archive[0]
+        loader = self.loader or root_loader
+        executor = None
+        try:
+            if pending is None or file.name in pending:
+                text, document, self.load_times[file.name] = _load_schema_file(root_loader, file.name)
+
+                root_name = normalize_file_name(self.domain or "", file.name)[0]
+                graph.add_file(file.name, 0)
+                # Collect the references of this file only
+                seen_refs, self.seen_refs = self.seen_refs, set()
+                lines = (
+                    self.iter_ir(document, fail_on_error_in_defs)
+                    if build_ir
+                    else self._iter_schema_text(text, document, fail_on_error_in_defs)
+                )
+                try:
+                    yield root_name, lines
+                    # Consume the lines that were not used, to discover all the references
+                    for _line in lines:
+                        pass
+                finally:
+                    root_refs, self.seen_refs = self.seen_refs, seen_refs
+                self._set_file_references(file.name, root_refs, pending, ref_depth)
+                self.parsed_refs.add(file.name)
+
+            if self.domain:
+                executor = (
+                    concurrent.futures.ProcessPoolExecutor(
+                        max_workers=jobs,
+                        initializer=_init_render_worker,
+                        initargs=(self, _get_locale()),
+                    )
+                    if jobs > 1
+                    else concurrent.futures.ThreadPoolExecutor(max_workers=self.load_workers)
+                )
+                # The files are rendered by increasing depth, the depth of a file being the length
+                # of its shortest reference path from the root file
+                for depth in range(1, ref_depth + 1):
+                    to_parse = [
+                        name
+                        for name in graph.files_at_depth(depth)
+                        if name not in self.parsed_refs and (pending is None or name in pending)
+                    ]
+
+                    if self._batch_refs is not None and not build_ir:
+                        # The files already rendered in the batch are only followed
+                        for ref in to_parse:
+                            batch_key = self._batch_key(loader, ref, fail_on_error_in_defs)
+                            batch_refs = self._batch_refs.get(batch_key)
+                            if batch_refs is not None:
+                                self._set_file_references(ref, batch_refs, pending, ref_depth)
+                                self.parsed_refs.add(ref)
+                        to_parse = [ref for ref in to_parse if ref not in self.parsed_refs]
+
+                    # Load (and render) all the files of the depth in parallel, and output them in order
+                    tasks: list[concurrent.futures.Future[Any]] = [
+                        executor.submit(
+                            _build_schema_file if build_ir else _render_schema_file,
+                            loader,
+                            ref,
+                            fail_on_error_in_defs,
+                        )
+                        if jobs > 1
+                        else executor.submit(_load_schema_file, loader, ref)
+                        for ref in to_parse
+                    ]
+                    for ref, task in zip(to_parse, tasks, strict=True):
+                        try:
+                            result = task.result()
+                        except FileNotFoundError:
+                            print(f'WARN: Referenced file "{ref}" does not exist, skipping.')
+                            self.parsed_refs.add(ref)
+                            continue
+
+                        ref_name = normalize_file_name(self.domain, (file.parent / ref).name)[0]
+                        if jobs > 1:
+                            ref_lines, ref_refs, self.load_times[ref] = result
+                            yield ref_name, iter(ref_lines)
+                        else:
+                            text, document, self.load_times[ref] = result
+                            # Collect the references of this file only
+                            seen_refs, self.seen_refs = self.seen_refs, set()
+                            lines = (
+                                self.iter_ir(document, fail_on_error_in_defs)
+                                if build_ir
+                                else self._iter_schema_text(text, document, fail_on_error_in_defs)
+                            )
+                            try:
+                                yield ref_name, lines
+                                for _line in lines:
+                                    pass
+                            finally:
+                                ref_refs, self.seen_refs = self.seen_refs, seen_refs
+                        self._set_file_references(ref, ref_refs, pending, ref_depth)
                         self.parsed_refs.add(ref)
-                        continue
+                        if self._batch_refs is not None and not build_ir:
+                            batch_key = self._batch_key(loader, ref, fail_on_error_in_defs)
+                            self._batch_refs[batch_key] = ref_refs
+
+                remaining = sum(
+                    1
+                    for name in graph.depths
+                    if name not in self.parsed_refs and (pending is None or name in pending)
+                )
+                if remaining > 0:
+                    print(f"WARN: Reached maximum depth. Refusing to parse {remaining} remaining references!")
 
-                    with ref_file.open(encoding="utf-8") as f:
-                        ref_obj = json.load(f)
+            graph.update_depths(file.name)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            root_loader.close()
 
-                    ref_name = normalize_file_name(self.domain, ref_file.name)[0]
-                    parsed_files[ref_name] = self.parse_schema(ref_obj, fail_on_error_in_defs)
+    def iter_directory(
+        self,
+        directory: Path,
+        fail_on_error_in_defs: bool = True,
+        locale: str | None = None,
+        jobs: int = 1,
+    ) -> Iterator[tuple[str, Iterator[str]]]:
+        """
+        Parse the JSON Schema files of a directory tree to Markdown text, yielding the lines as they are rendered.
 
-                    self.parsed_refs.add(ref)
+        All the `.json` files of the tree are rendered once, sorted by path, so the references
+        between them aren't followed; the relative links are relative to the directory of the
+        file. With more than one job, the files are loaded and rendered by `jobs` processes.
+        The title and the description of each file are then available in `directory_entries`,
+        for `render_index`.
 
-            remaining = len(self.seen_refs - self.parsed_refs)
-            if remaining > 0:
-                print(f"WARN: Reached maximum depth. Refusing to parse {remaining} remaining references!")
+        Parameters
+        ----------
+        directory: Path
+            The root directory of the JSON Schema files.
+        fail_on_error_in_defs: bool
+            If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schemas. If False, the method will attempt to continue parsing
+            despite such errors.
+        locale: Optional[str]
+            The locale to use for translations. If None, the default locale will be used.
+        jobs : int, default 1
+            The number of processes that render the files.
+
+        Yields
+        ------
+        tuple[str, Iterator[str]]
+            The path of the file in the directory, without `.json` extension (e.g. `sub/person`),
+            and an iterator over the lines of the Markdown documentation of the file.
+        """
+        names = sorted(
+            (path.relative_to(directory).as_posix() for path in directory.rglob("*.json") if path.is_file()),
+            key=lambda name: name.split("/"),
+        )
+        loader = FileLoader(directory)
+        self.load_times = {}
+        self.directory_entries = {}
+        executor = None
+        try:
+            with _use_locale(locale):
+                if jobs > 1:
+                    executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=jobs,
+                        initializer=_init_render_worker,
+                        initargs=(self, _get_locale()),
+                    )
+                    tasks = [
+                        executor.submit(_render_directory_file, loader, name, fail_on_error_in_defs)
+                        for name in names
+                    ]
+                    for name, task in zip(names, tasks, strict=True):
+                        lines, entry, self.load_times[name] = task.result()
+                        schema_id = normalize_file_name("", name)[0]
+                        self.directory_entries[schema_id] = entry
+                        yield schema_id, iter(lines)
+                else:
+                    for name in names:
+                        text, document, self.load_times[name] = _load_schema_file(loader, name)
+                        schema_id = normalize_file_name("", name)[0]
+                        self.directory_entries[schema_id] = _directory_entry(document)
+                        self._link_directory = posixpath.dirname(name)
+                        yield schema_id, self._iter_schema_text(text, document, fail_on_error_in_defs)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self._link_directory = ""
+            self.seen_refs = set()
+
+    def render_index(self, title: str, entries: Mapping[str, tuple[str | None, str | None]]) -> list[str]:
+        """
+        Render the index page of the files of a directory, see `iter_directory`.
+
+        The files are listed by directory, with their title, or their name, and their description.
 
-        Parser.current_locale = None
-        self.seen_refs = set()
-        self.parsed_refs = set()
+        Parameters
+        ----------
+        title: str
+            The title of the index page.
+        entries: Mapping[str, tuple[Optional[str], Optional[str]]]
+            The title and the description of the files, by path without `.json` extension.
 
-        return parsed_files
+        Returns
+        -------
+        list[str]
+            The lines of the index page.
+        """
+        lines = [f"{'#' * (self.header_level + 1)} {title}\n\n"]
+        previous_directories: list[str] = []
+        for schema_id in sorted(entries, key=lambda schema_id: schema_id.split("/")):
+            *directories, name = schema_id.split("/")
+            common = 0
+            while (
+                common < min(len(previous_directories), len(directories))
+                and previous_directories[common] == directories[common]
+            ):
+                common += 1
+            lines.extend(
+                [
+                    f"{' ' * self.tab_size * depth}- **{directories[depth]}/**\n"
+                    for depth in range(common, len(directories))
+                ]
+            )
+            previous_directories = directories
+
+            entry_title, description = entries[schema_id]
+            file_name = self.schema_mapping.get(schema_id, f"{schema_id}.md")
+            description_formatted = "" if not description else f": {' '.join(description.split())}"
+            lines.append(
+                f"{' ' * self.tab_size * len(directories)}- [{entry_title or name}](./{quote(file_name)})"
+                f"{description_formatted}\n"
+            )
+        return lines
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Share the referenced files between the `iter_file` calls of a batch of files.
+
+        A file referenced by several files of the batch is loaded and rendered once, by the
+        first `iter_file` that reaches it; the next ones only follow its references.
+        """
+        self._batch_refs = {}
+        try:
+            yield
+        finally:
+            self._batch_refs = None
+
+    @staticmethod
+    def _batch_key(loader: Loader, name: str, fail_on_error_in_defs: bool) -> tuple[str, str | None, bool]:
+        """Get the key of a referenced file in the batch."""
+        return loader.location(name), _get_locale(), fail_on_error_in_defs
+
+    def _set_file_references(
+        self,
+        name: str,
+        references: set[str],
+        pending: set[str] | None,
+        ref_depth: int,
+    ) -> None:
+        """Set the references of a rendered file, the files that weren't rendered yet become pending."""
+        graph = self.dependency_graph
+        if pending is not None:
+            pending.update(
+                reference
+                for reference in references
+                if graph.depths.get(reference, ref_depth + 1) > ref_depth
+            )
+        graph.set_references(name, references)
+        self.seen_refs |= references
+
+    def _cache_options(self, fail_on_error_in_defs: bool) -> str:
+        """Get the options that change the rendered files, for the render cache key."""
+        return json.dumps(
+            [
+                self.examples_as_yaml,
+                self.show_examples,
+                self.show_deprecated,
+                self.collapse_children,
+                self.header_level,
+                self.ignore_patterns,
+                self.domain,
+                self.relative,
+                sorted(self.schema_mapping.items()),
+                self.max_depth,
+                self.inline_refs,
+                self.tab_size,
+                fail_on_error_in_defs,
+                _get_locale(),
+                self._link_directory,
+            ],
+        )
+
+    def _iter_schema_text(self, text: str, document: Any, fail_on_error_in_defs: bool) -> Iterator[str]:
+        """
+        Parse a JSON Schema file, its text and its parsed JSON, to markdown text, through the render cache if any.
+
+        The references of the file are added to `seen_refs` once the lines are consumed.
+        """
+        if self.render_cache is None:
+            return self.iter_schema(document, fail_on_error_in_defs)
+
+        key = self.render_cache.key(text, self._cache_options(fail_on_error_in_defs))
+        entry = self.render_cache.get(key)
+        if entry is not None:
+            cached_lines, cached_refs = entry
+            self.seen_refs.update(cached_refs)
+            return iter(cached_lines)
+
+        seen_refs, self.seen_refs = self.seen_refs, set()
+        try:
+            lines = list(self.iter_schema(document, fail_on_error_in_defs))
+        finally:
+            refs, self.seen_refs = self.seen_refs, seen_refs | self.seen_refs
+        self.render_cache.set(key, lines, sorted(refs))
+        return iter(lines)
 
     def parse_schema(
         self,
@@ -729,93 +2899,509 @@ class Parser:
         -------
             A list of strings representing the parsed Markdown documentation.
         """
-        output_lines = []
+        return list(self.iter_schema(schema_object, fail_on_error_in_defs))
+
+    def iter_schema(
+        self,
+        schema_object: dict[str, Any],
+        fail_on_error_in_defs: bool = True,
+    ) -> Iterator[str]:
+        """
+        Parse JSON Schema object to markdown text, yielding the lines as they are rendered.
+
+        Parameters
+        ----------
+        schema_object: The JSON Schema object to parse.
+        fail_on_error_in_defs: If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schema. If False, the method will attempt to continue parsing
+            despite such errors.
+
+        Yields
+        ------
+            The lines of the parsed Markdown documentation.
+        """
+        return self.render_ir(self.iter_ir(schema_object, fail_on_error_in_defs), fail_on_error_in_defs)
+
+    def build_ir(
+        self,
+        schema_object: dict[str, Any],
+        fail_on_error_in_defs: bool = True,
+    ) -> tuple[SchemaRecord, ...]:
+        """
+        Build the intermediate representation of a JSON Schema object.
+
+        The intermediate representation holds the structure of the schema, after the references
+        inlining, the ignore patterns and the deprecated properties are applied. It can be
+        rendered several times with `render_ir`, with other rendering options (`header_level`,
+        `collapse_children`, `examples_as_yaml`, `show_examples`) or locales, and pickled.
+
+        Parameters
+        ----------
+        schema_object: The JSON Schema object to parse.
+        fail_on_error_in_defs: If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schema. If False, the method will attempt to continue parsing
+            despite such errors.
+
+        Returns
+        -------
+            The records of the schema, in document order.
+
+        Examples
+        --------
+        >>> schema_ir = parser.build_ir(schema)
+        >>> french_lines = list(parser.render_ir(schema_ir, locale="fr"))
+        """
+        return tuple(self.iter_ir(schema_object, fail_on_error_in_defs))
+
+    def iter_ir(
+        self,
+        schema_object: dict[str, Any],
+        fail_on_error_in_defs: bool = True,
+    ) -> Iterator[SchemaRecord]:
+        """
+        Build the intermediate representation of a JSON Schema object, yielding the records as they are built.
+
+        Parameters
+        ----------
+        schema_object: The JSON Schema object to parse.
+        fail_on_error_in_defs: If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schema. If False, the method will attempt to continue parsing
+            despite such errors.
+
+        Yields
+        ------
+            The records of the schema, in document order.
+        """
+        index = SchemaIndex(schema_object) if self.inline_refs > 0 else None
 
         # Add title and description
-        if "title" in schema_object:
-            output_lines.append(f"{'#' * (self.header_level + 1)} {schema_object['title']}\n\n")
-        else:
-            output_lines.append(f"{'#' * (self.header_level + 1)} {_('JSON Schema')}\n\n")
-        if "description" in schema_object:
-            output_lines.append(f"*{schema_object['description']}*\n\n")
+        yield DocumentHeader(schema_object.get("title"), schema_object.get("description"))
 
         # Add items
         if "items" in schema_object:
-            output_lines.append(f"#{'#' * (self.header_level + 1)} {_('Items')}\n\n")
-            output_lines.extend(
-                self._parse_object(
-                    schema_object["items"],
-                    path=["items"],
-                    name=_("Items"),
-                    name_monospace=False,
-                ),
+            yield SectionHeader("items")
+            yield from self._build_object(
+                schema_object["items"],
+                path=["items"],
+                name="items",
+                keyword_name=True,
+                name_monospace=False,
+                index=index,
             )
 
         # Add additional/unevaluated properties
-        for extra_props in ["additional", "unevaluated"]:
-            property_name = f"{extra_props}Properties"
-            title_ = (
-                _("Additional properties") if extra_props == "additional" else _("Unevaluated properties")
-            )
+        for property_name in ["additionalProperties", "unevaluatedProperties"]:
             if property_name in schema_object and isinstance(schema_object[property_name], dict):
-                output_lines.append(f"#{'#' * (self.header_level + 1)} {title_}\n\n")
-                output_lines.extend(
-                    self._parse_object(
-                        schema_object[property_name],
-                        path=[property_name],
-                        name=title_,
-                        name_monospace=False,
-                    ),
+                yield SectionHeader(property_name)
+                yield from self._build_object(
+                    schema_object[property_name],
+                    path=[property_name],
+                    name=property_name,
+                    keyword_name=True,
+                    name_monospace=False,
+                    index=index,
                 )
 
         # Add pattern properties
         if "patternProperties" in schema_object:
-            output_lines.append(f"#{'#' * (self.header_level + 1)} {_('Pattern Properties')}\n\n")
+            yield SectionHeader("patternProperties")
             for obj_name, obj in schema_object["patternProperties"].items():
-                output_lines.extend(self._parse_object(obj, path=["patternProperties"], name=obj_name))
+                yield from self._build_object(
+                    obj,
+                    path=["patternProperties"],
+                    name=obj_name,
+                    index=index,
+                )
 
         # Add properties
         if "properties" in schema_object:
-            output_lines.append(f"#{'#' * (self.header_level + 1)} {_('Properties')}\n\n")
+            yield SectionHeader("properties")
             for obj_name, obj in schema_object["properties"].items():
                 required = obj_name in schema_object.get("required", [])
-                output_lines.extend(
-                    self._parse_object(
-                        obj,
-                        path=["properties", obj_name],
-                        name=obj_name,
-                        required=required,
-                        dependent_required=[
-                            k for k, v in schema_object.get("dependentRequired", {}).items() if obj_name in v
-                        ],
-                    ),
+                yield from self._build_object(
+                    obj,
+                    path=["properties", obj_name],
+                    name=obj_name,
+                    required=required,
+                    dependent_required=[
+                        k for k, v in schema_object.get("dependentRequired", {}).items() if obj_name in v
+                    ],
+                    index=index,
                 )
 
         # Add definitions / $defs
         for name in ["definitions", "$defs"]:
             if name in schema_object:
-                output_lines.append(f"#{'#' * (self.header_level + 1)} {_('Definitions')}\n\n")
+                yield SectionHeader(name)
                 for obj_name, obj in schema_object[name].items():
+                    records = self._build_object(obj, path=[name, obj_name], name=obj_name, index=index)
                     try:
-                        output_lines.extend(self._parse_object(obj, path=[name, obj_name], name=obj_name))
+                        if fail_on_error_in_defs:
+                            yield DefinitionStart(name, obj_name)
+                            yield from records
+                        else:
+                            # Buffered to skip the whole definition on error
+                            definition_records = list(records)
+                            yield DefinitionStart(name, obj_name)
+                            yield from definition_records
+                        yield DefinitionEnd(name, obj_name)
                     except Exception as exception:  # pylint: disable=broad-exception-caught
-                        message = f"Error parsing {obj_name} from {name} in schema, usually it occurs when the kind of def is not supported."
+                        message = _definition_error_message(name, obj_name)
                         if fail_on_error_in_defs:
                             raise ValueError(message) from exception
                         print(f"WARN: {message}")
 
         # Add examples
-        if "examples" in schema_object and self.show_examples in ["all", "object"]:
-            output_lines.append(f"#{'#' * (self.header_level + 1)} {_('Examples')}\n\n")
-            output_lines.extend(self._construct_examples(schema_object, indent_level=0, add_header=False))
+        if "examples" in schema_object:
+            yield DocumentExamples(schema_object["examples"])
 
-        return output_lines
+    def render_ir(
+        self,
+        records: Iterable[SchemaRecord],
+        fail_on_error_in_defs: bool = True,
+        locale: str | None = None,
+    ) -> Iterator[str]:
+        """
+        Render the intermediate representation of a JSON Schema object to markdown text.
+
+        Parameters
+        ----------
+        records: The records built by `build_ir` or `iter_ir`.
+        fail_on_error_in_defs: If True, the method will raise an error when encountering issues in the
+            "definitions" section of the schema. If False, the method will attempt to continue rendering
+            despite such errors.
+        locale: The locale to use for translations. If None, the current locale is used.
+
+        Yields
+        ------
+            The lines of the Markdown documentation.
+        """
+        with _use_locale(locale):
+            # The definition being rendered, and its lines when they are buffered to skip
+            # the whole definition on error
+            definition: DefinitionStart | None = None
+            definition_lines: list[str] | None = None
+            skip_definition = False
+            for record in records:
+                if isinstance(record, DefinitionStart):
+                    definition = record
+                    definition_lines = None if fail_on_error_in_defs else []
+                    skip_definition = False
+                elif isinstance(record, DefinitionEnd):
+                    if definition_lines is not None and not skip_definition:
+                        yield from definition_lines
+                    definition = None
+                    definition_lines = None
+                elif definition is None:
+                    yield from self._render_record(record)
+                elif not skip_definition:
+                    try:
+                        lines = list(self._render_record(record))
+                    except Exception as exception:  # pylint: disable=broad-exception-caught
+                        message = _definition_error_message(definition.keyword, definition.name)
+                        if fail_on_error_in_defs:
+                            raise ValueError(message) from exception
+                        print(f"WARN: {message}")
+                        skip_definition = True
+                        continue
+                    if definition_lines is None:
+                        yield from lines
+                    else:
+                        definition_lines.extend(lines)
+
+
+# The parser of a rendering worker process, see `Parser.iter_file`
+_worker_parsers: dict[str, Parser] = {}
+
+
+def _init_render_worker(parser: Parser, locale: str | None) -> None:
+    """Initialize a rendering worker process with a copy of the parser."""
+    _worker_parsers["parser"] = parser
+    _locale_context.set(locale)
+
+
+def _render_schema_file(
+    loader: Loader,
+    name: str,
+    fail_on_error_in_defs: bool,
+) -> tuple[list[str], set[str], float]:
+    """Render a JSON Schema file in a worker process, with the references it contains and its load time."""
+    parser = _worker_parsers["parser"]
+    parser.seen_refs = set()
+    text, document, load_time = _load_schema_file(loader, name)
+    lines = list(parser._iter_schema_text(text, document, fail_on_error_in_defs))  # noqa: SLF001 # pylint: disable=protected-access
+    return lines, parser.seen_refs, load_time
+
+
+def _build_schema_file(
+    loader: Loader,
+    name: str,
+    fail_on_error_in_defs: bool,
+) -> tuple[tuple[SchemaRecord, ...], set[str], float]:
+    """Build the intermediate representation of a JSON Schema file in a worker process, with its references and its load time."""
+    parser = _worker_parsers["parser"]
+    parser.seen_refs = set()
+    _text, document, load_time = _load_schema_file(loader, name)
+    schema_ir = parser.build_ir(document, fail_on_error_in_defs)
+    return schema_ir, parser.seen_refs, load_time
+
+
+def _render_locale_files(
+    files_ir: Mapping[str, tuple[SchemaRecord, ...]],
+    locale: str,
+    fail_on_error_in_defs: bool,
+) -> dict[str, Sequence[str]]:
+    """Render the intermediate representation of the files in a locale in a worker process."""
+    parser = _worker_parsers["parser"]
+    return {
+        name: list(parser.render_ir(schema_ir, fail_on_error_in_defs, locale))
+        for name, schema_ir in files_ir.items()
+    }
+
+
+def _render_directory_file(
+    loader: Loader,
+    name: str,
+    fail_on_error_in_defs: bool,
+) -> tuple[list[str], tuple[str | None, str | None], float]:
+    """Render a JSON Schema file of a directory in a worker process, with its index entry and its load time."""
+    parser = _worker_parsers["parser"]
+    parser._link_directory = posixpath.dirname(name)  # noqa: SLF001 # pylint: disable=protected-access
+    text, document, load_time = _load_schema_file(loader, name)
+    lines = list(parser._iter_schema_text(text, document, fail_on_error_in_defs))  # noqa: SLF001 # pylint: disable=protected-access
+    return lines, _directory_entry(document), load_time
+
+
+def _parse_inputs(arguments: Sequence[str], output_directory: Path | None = None) -> list[tuple[Path, Path]]:
+    """
+    Get the input JSON files and their output Markdown files from the command line arguments.
+
+    Without an output directory, two files or directories are an input and an output. Otherwise,
+    the arguments are input files, glob patterns, and `input:output` pairs; the output of an input
+    file is the file with the `.md` extension, in the output directory if there is one.
+    """
+    if (
+        output_directory is None
+        and len(arguments) == 2
+        and not any(_GLOB_CHARACTERS.search(argument) for argument in arguments)
+        and not any(_INPUT_OUTPUT_PAIR.fullmatch(argument) for argument in arguments)
+    ):
+        return [(Path(arguments[0]), Path(arguments[1]))]
+
+    def output(file: Path) -> Path:
+        markdown_file = file.with_suffix(".md")
+        return markdown_file if output_directory is None else output_directory / markdown_file.name
+
+    inputs = []
+    for argument in arguments:
+        pair = _INPUT_OUTPUT_PAIR.fullmatch(argument)
+        if pair is not None:
+            inputs.append((Path(pair.group(1)), Path(pair.group(2))))
+        elif _GLOB_CHARACTERS.search(argument):
+            files = sorted(glob.glob(argument, recursive=True))  # noqa: PTH207
+            if not files:
+                message = f"No file matches `{argument}`."
+                raise ValueError(message)
+            inputs.extend((Path(file), output(Path(file))) for file in files)
+        else:
+            inputs.append((Path(argument), output(Path(argument))))
+
+    outputs = [output_markdown for _input_json, output_markdown in inputs]
+    duplicates = sorted({str(file) for file in outputs if outputs.count(file) > 1})
+    if duplicates:
+        message = f"Several inputs are written to {', '.join(duplicates)}."
+        raise ValueError(message)
+    return inputs
+
+
+def _write_file(file: Path, lines: Iterable[str]) -> bool:
+    """
+    Write a Markdown file if its content changed; get whether it was written.
+
+    The lines are compared with the existing file as they are rendered, and only written in a
+    temporary file from the first difference, so the whole document is never held in memory.
+    """
+    # Through a symbolic link, the target file is written
+    target = file.resolve() if file.is_symlink() else file
+    chunks = (line.replace("\n", os.linesep).encode("utf-8") for line in lines)
+    with contextlib.ExitStack() as stack:
+        try:
+            existing: IO[bytes] | None = stack.enter_context(target.open("rb"))
+        except FileNotFoundError:
+            existing = None
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+        # The size of the common start with the existing file, and the first different chunk
+        matched = 0
+        chunk = b""
+        if existing is not None:
+            for chunk in chunks:
+                if existing.read(len(chunk)) != chunk:
+                    break
+                matched += len(chunk)
+            else:
+                if not existing.read(1):
+                    # The existing file is left untouched, to keep its modification time
+                    return False
+                chunk = b""
+
+        # Written in a temporary file then renamed, a reader never gets a partial file
+        temporary_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            with temporary_path.open("wb") as temporary_file:
+                if existing is not None:
+                    existing.seek(0)
+                    while matched > 0:
+                        block = existing.read(min(matched, 64 * 1024))
+                        temporary_file.write(block)
+                        matched -= len(block)
+                temporary_file.write(chunk)
+                for chunk in chunks:
+                    temporary_file.write(chunk)
+            if existing is not None:
+                # Keep the mode of the existing file
+                temporary_path.chmod(target.stat().st_mode & 0o7777)
+            temporary_path.replace(target)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+    return True
+
+
+def _write_files(
+    files: Iterator[tuple[str, Iterator[str]]],
+    output_markdown: Path,
+    schema_mapping: Mapping[str, str],
+    root_changed: bool = True,
+    output_directory: Path = Path(),
+) -> tuple[list[Path], list[Path]]:
+    """
+    Write the Markdown files, the first one is the input one if it changed; get the written and the unchanged files.
+
+    The other files are written in the output directory, to the file of their schema id in the schema mapping.
+    """
+    written: list[Path] = []
+    unchanged: list[Path] = []
+    if root_changed:
+        # The first file is the input one
+        _root_name, lines = next(files)
+        (written if _write_file(output_markdown, lines) else unchanged).append(output_markdown)
+
+    for schema_id, file_lines in files:
+        file_name = output_directory / schema_mapping.get(schema_id, f"{schema_id}.md")
+        (written if _write_file(file_name, file_lines) else unchanged).append(file_name)
+    return written, unchanged
+
+
+def _depends_on(input_json: Path, dependency_graph: DependencyGraph, changed_paths: set[Path]) -> bool:
+    """Check if the dependency graph of an input file contains one of the changed files."""
+    if input_json.is_dir():
+        directory = input_json.resolve()
+        return any(directory in path.parents for path in changed_paths)
+    base_directory = input_json.parent
+    return any((base_directory / name).resolve() in changed_paths for name in dependency_graph.depths)
+
+
+def _file_signature(file: Path) -> tuple[int, int] | None:
+    """Get the modification time and the size of a file, `None` if it doesn't exist or can't be read."""
+    try:
+        stat = file.stat()
+    except OSError:
+        # E.g. during the atomic save of an editor, the file is renamed
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _watch(parser: Parser, args: argparse.Namespace, schema_mapping: Mapping[str, str]) -> None:
+    """
+    Render the changed files again, until interrupted.
+
+    The input file and the referenced files are polled, the parser is kept with its caches,
+    and only the changed files and the new files they reference are rendered.
+    """
+    base_directory = args.input_json.parent
+
+    def signatures(known: Mapping[str, tuple[int, int] | None]) -> dict[str, tuple[int, int] | None]:
+        """Get the signatures of the files of the graph, the known ones are kept."""
+        return {
+            name: known[name] if name in known else _file_signature(base_directory / name)
+            for name in parser.dependency_graph.depths
+        }
+
+    previous_signatures = signatures({})
+    print(f"Watching {len(previous_signatures)} files, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(args.watch_interval)
+            current_signatures = signatures({})
+            changed_files = [
+                name
+                for name, signature in current_signatures.items()
+                if previous_signatures.get(name) != signature
+            ]
+            if not changed_files:
+                continue
+
+            start = time.perf_counter()
+            try:
+                files = parser.iter_changed_files(
+                    args.input_json,
+                    changed_files,
+                    parser.dependency_graph,
+                    args.fail_on_error_in_defs,
+                    args.ref_depth,
+                    args.locale,
+                    args.jobs,
+                )
+                written, unchanged = _write_files(
+                    files,
+                    args.output_markdown,
+                    schema_mapping,
+                    args.input_json.name in changed_files,
+                )
+            except (ValueError, TypeError, OSError) as error:
+                # Keep watching, the error is probably fixed in the next save, and a missing file,
+                # e.g. during an atomic save, is changed when it's back
+                print(f"ERROR: {error}")
+            else:
+                print(
+                    f"Rendered {len(written) + len(unchanged)} files in {(time.perf_counter() - start) * 1000:.0f} ms, "
+                    f"{len(written)} written, {len(unchanged)} unchanged.",
+                )
+            # The signatures before the render, so a save during the render is seen by the next poll,
+            # only the files newly referenced are read
+            previous_signatures = signatures(current_signatures)
+    except KeyboardInterrupt:
+        pass
+
+
+class _VersionAction(argparse.Action):
+    """Print the version, that is only resolved when the option is used."""
+
+    def __init__(self, option_strings: Sequence[str], dest: str) -> None:
+        super().__init__(
+            option_strings,
+            dest,
+            nargs=0,
+            default=argparse.SUPPRESS,
+            help="show program's version number and exit",
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        _namespace: argparse.Namespace,
+        _values: Any,
+        _option_string: str | None = None,
+    ) -> None:
+        print(f"{parser.prog} {_get_version()}")
+        parser.exit()
 
 
 def main() -> None:
     """Convert JSON Schema to Markdown documentation."""
     argparser = argparse.ArgumentParser("Convert JSON Schema to Markdown documentation.")
-    argparser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    argparser.add_argument("--version", action=_VersionAction)
     argparser.add_argument(
         "--pre-commit",
         action="store_true",
@@ -864,6 +3450,93 @@ def main() -> None:
         default=10,
         help="The maximum depth to follow references.",
     )
+    argparser.add_argument(
+        "--inline-refs",
+        type=int,
+        default=0,
+        help="The number of nested levels of local references to inline instead of linking them.",
+    )
+    argparser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="The directory of the cache of the rendered files.",
+    )
+    argparser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use the cache of the rendered files, even with --cache-dir.",
+    )
+    argparser.add_argument(
+        "--cache-max-size",
+        type=float,
+        default=100,
+        help="The maximum size of the cache in MiB.",
+    )
+    argparser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=30,
+        help="The maximum number of days since an entry of the cache was used.",
+    )
+    argparser.add_argument(
+        "--ref-url",
+        default=None,
+        help=(
+            "The URL of the directory of the referenced files, e.g. `https://example.com/schemas/`, "
+            "to load them from an HTTP server instead of the directory of the input file."
+        ),
+    )
+    argparser.add_argument(
+        "--http-cache-dir",
+        type=Path,
+        default=None,
+        help="The directory of the cache of the files loaded from --ref-url.",
+    )
+    argparser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Only read the files of --ref-url from the cache of --http-cache-dir.",
+    )
+    argparser.add_argument(
+        "--dependency-graph",
+        type=Path,
+        default=None,
+        help="Write the graph of the references between the files, in DOT format for a `.dot` file, else in JSON.",
+    )
+    argparser.add_argument(
+        "--incremental",
+        type=Path,
+        default=None,
+        help=(
+            "Path of the dependency index of the files. If it exists, only the changed files read from the "
+            "standard input (one per line, e.g. from `git diff --name-only`) are rendered again, "
+            "else all the files are rendered. The index is updated at the end."
+        ),
+    )
+    argparser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the generation, render the changed files again until interrupted.",
+    )
+    argparser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.1,
+        help="The interval in seconds between two checks of the files in watch mode.",
+    )
+    argparser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of processes that render the referenced files.",
+    )
+    argparser.add_argument(
+        "--load-workers",
+        type=int,
+        default=None,
+        help="The number of threads that load the referenced files.",
+    )
     argparser.add_argument(
         "--schema-mapping",
         type=Path,
@@ -882,12 +3555,67 @@ def main() -> None:
         default=None,
         help="Locale for the output Markdown. If not set, defaults to the first of $LANGUAGE, $LC_ALL, $LC_CTYPE, and $LANG.",
     )
-    argparser.add_argument("input_json", type=Path, help="Input JSON file.")
-    argparser.add_argument("output_markdown", type=Path, help="Output Markdown file.")
+    argparser.add_argument(
+        "--locales",
+        default=None,
+        help=(
+            "Comma-separated locales, e.g. `fr,pt_BR`, the files are loaded and analyzed once, then rendered "
+            "in each locale, in a subdirectory named after the locale in the directory of the output file."
+        ),
+    )
+    argparser.add_argument(
+        "--index-name",
+        default="index.md",
+        help="The name of the index page of an input directory, in the output directory.",
+    )
+    argparser.add_argument(
+        "--changed-files",
+        nargs="*",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help=(
+            "The changed files, e.g. the staged files given by pre-commit, this option should be the last one. "
+            "Only the changed input files and the files they reference are rendered, with --incremental, "
+            "the changed files of the index. Without input file, each changed file is an input file, "
+            "rendered to the file of its schema id in the schema mapping, else to the same file with "
+            "the `.md` extension."
+        ),
+    )
+    argparser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help=(
+            "The directory of the output Markdown files, all the arguments are then input files, "
+            "e.g. `--output-dir=docs a.json b.json`."
+        ),
+    )
+    argparser.add_argument(
+        "inputs",
+        nargs="*",
+        metavar="input",
+        help=(
+            "The input JSON file and the output Markdown file, the input directory and the output directory, "
+            "or several input JSON files, glob patterns "
+            "(e.g. `schemas/**/*.json`) or `input.json:output.md` pairs; by default the output file of an "
+            "input file is the same file with the `.md` extension, use --output-dir for two input files. "
+            "All the files are rendered in one process, sharing the referenced files."
+        ),
+    )
 
     args = argparser.parse_args()
 
-    if args.locale is None:
+    try:
+        inputs = _parse_inputs(args.inputs, args.output_dir)
+    except ValueError as error:
+        argparser.error(str(error))
+    if not inputs and args.changed_files is None:
+        argparser.error("an input file is required.")
+
+    if args.locale is None and args.locales is None:
+        from babel import default_locale, negotiate_locale  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
         env_locale = default_locale() or "en_US"
 
         if env_locale not in get_locales():
@@ -902,8 +3630,16 @@ def main() -> None:
 
         args.locale = env_locale
 
+    if args.locales is not None:
+        args.locales = [locale.strip() for locale in args.locales.split(",") if locale.strip()]
+        unknown_locales = [locale for locale in args.locales if locale not in get_locales()]
+        if unknown_locales:
+            argparser.error(f"unsupported locales: {', '.join(unknown_locales)}.")
+
     schema_mapping = None
     if args.schema_mapping:
+        import yaml  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
         with args.schema_mapping.open(encoding="utf-8") as mapping_file:
             schema_mapping = yaml.safe_load(mapping_file)
 
@@ -915,24 +3651,192 @@ def main() -> None:
         domain=args.domain,
         relative=args.relative,
         schema_mapping=schema_mapping,
+        inline_refs=args.inline_refs,
+        load_workers=args.load_workers,
+        render_cache=(
+            RenderCache(
+                args.cache_dir,
+                max_size=int(args.cache_max_size * 1024 * 1024),
+                max_age=args.cache_max_age * 24 * 3600,
+            )
+            if args.cache_dir is not None and not args.no_cache
+            else None
+        ),
+        loader=(
+            HttpLoader(args.ref_url, cache_directory=args.http_cache_dir, offline=args.offline)
+            if args.ref_url is not None
+            else None
+        ),
     )
-    files = parser.parse_file(args.input_json, args.fail_on_error_in_defs, args.ref_depth, args.locale)
+    schema_mapping = schema_mapping or {}
+
+    changed_paths: set[Path] | None = None
+    if args.changed_files is not None and not inputs:
+        for file in args.changed_files:
+            schema_id = normalize_file_name(args.domain or "", file.name)[0]
+            inputs.append(
+                (
+                    file,
+                    Path(schema_mapping[schema_id])
+                    if schema_id in schema_mapping
+                    else file.with_suffix(".md"),
+                )
+            )
+    elif args.changed_files is not None and args.incremental is None:
+        # The inputs are only written when their dependency graph contains a changed file
+        changed_paths = {file.resolve() for file in args.changed_files}
+    if not inputs:
+        return
+    if (len(inputs) > 1 or inputs[0][0].is_dir()) and (
+        args.incremental or args.watch or args.dependency_graph
+    ):
+        argparser.error("--incremental, --watch and --dependency-graph need a single input file.")
+    if args.locales and (
+        args.incremental or args.watch or any(input_json.is_dir() for input_json, _ in inputs)
+    ):
+        argparser.error("--locales doesn't support --incremental, --watch and the input directories.")
+    args.input_json, args.output_markdown = inputs[0]
+
+    dependency_graph = None
+    changed_files: list[str] = []
+    if args.incremental is not None and args.incremental.exists():
+        with args.incremental.open(encoding="utf-8") as index_file:
+            dependency_graph = DependencyGraph.from_json(json.load(index_file))
+        # The changed files are relative to the directory of the input file in the graph
+        base_directory = args.input_json.parent.resolve()
+        for changed_file in args.changed_files if args.changed_files is not None else sys.stdin:
+            if str(changed_file).strip():
+                with contextlib.suppress(ValueError):
+                    changed_files.append(
+                        Path(str(changed_file).strip()).resolve().relative_to(base_directory).as_posix(),
+                    )
+
+    written: list[Path] = []
+    unchanged: list[Path] = []
+    timings = []
+    batch_start = time.perf_counter()
+    with parser.batch():
+        for input_json, output_markdown in inputs:
+            start = time.perf_counter()
+            if input_json.is_dir():
+                if changed_paths is not None and not _depends_on(
+                    input_json, parser.dependency_graph, changed_paths
+                ):
+                    continue
+                # The output is a directory with the same layout, and an index page
+                input_written, input_unchanged = _write_files(
+                    parser.iter_directory(input_json, args.fail_on_error_in_defs, args.locale, args.jobs),
+                    output_markdown,
+                    schema_mapping,
+                    root_changed=False,
+                    output_directory=output_markdown,
+                )
+                index_file = output_markdown / args.index_name
+                index_lines = parser.render_index(input_json.name, parser.directory_entries)
+                (input_written if _write_file(index_file, index_lines) else input_unchanged).append(
+                    index_file
+                )
+            elif args.locales:
+                # The files are loaded and analyzed once, then written in a directory per locale
+                input_written, input_unchanged = [], []
+                locales_files = parser.parse_file_locales(
+                    input_json,
+                    args.locales,
+                    args.fail_on_error_in_defs,
+                    args.ref_depth,
+                    args.jobs,
+                )
+                if changed_paths is not None and not _depends_on(
+                    input_json, parser.dependency_graph, changed_paths
+                ):
+                    continue
+                for locale, locale_files in locales_files.items():
+                    locale_directory = output_markdown.parent / locale
+                    locale_written, locale_unchanged = _write_files(
+                        ((name, iter(lines)) for name, lines in locale_files.items()),
+                        locale_directory / output_markdown.name,
+                        schema_mapping,
+                        output_directory=locale_directory,
+                    )
+                    input_written.extend(locale_written)
+                    input_unchanged.extend(locale_unchanged)
+            else:
+                if dependency_graph is not None:
+                    files = parser.iter_changed_files(
+                        input_json,
+                        changed_files,
+                        dependency_graph,
+                        args.fail_on_error_in_defs,
+                        args.ref_depth,
+                        args.locale,
+                        args.jobs,
+                    )
+                else:
+                    files = parser.iter_file(
+                        input_json,
+                        args.fail_on_error_in_defs,
+                        args.ref_depth,
+                        args.locale,
+                        args.jobs,
+                    )
+                if changed_paths is not None:
+                    # The whole graph is known once all the files are rendered
+                    rendered_files = [(name, list(lines)) for name, lines in files]
+                    if not _depends_on(input_json, parser.dependency_graph, changed_paths):
+                        continue
+                    files = ((name, iter(lines)) for name, lines in rendered_files)
+                input_written, input_unchanged = _write_files(
+                    files,
+                    output_markdown,
+                    schema_mapping,
+                    dependency_graph is None or input_json.name in changed_files,
+                )
+            written.extend(input_written)
+            unchanged.extend(input_unchanged)
+            timings.append(
+                (input_json, len(input_written) + len(input_unchanged), time.perf_counter() - start)
+            )
 
-    root_name = normalize_file_name(args.domain or "", args.input_json.name)[0]
+    if len(inputs) > 1:
+        for input_json, count, seconds in timings:
+            print(f"{input_json}: {count} files in {seconds * 1000:.0f} ms")
+        print(
+            f"Rendered {sum(count for _input, count, _seconds in timings)} files from {len(timings)} inputs "
+            f"in {(time.perf_counter() - batch_start) * 1000:.0f} ms.",
+        )
+    print(f"{len(written)} files written, {len(unchanged)} unchanged.")
+    if parser.render_cache is not None:
+        # Once per run, not per input
+        parser.render_cache.evict()
+
+    if args.dependency_graph is not None:
+        with args.dependency_graph.open("w", encoding="utf-8") as graph_file:
+            if args.dependency_graph.suffix == ".dot":
+                graph_file.write(parser.dependency_graph.to_dot())
+            else:
+                json.dump(parser.dependency_graph.to_json(), graph_file, indent=2)
+                graph_file.write("\n")
 
-    with args.output_markdown.open("w", encoding="utf-8") as output_markdown:
-        output_markdown.writelines(files.pop(root_name))
+    if args.incremental is not None:
+        with args.incremental.open("w", encoding="utf-8") as index_file:
+            json.dump(parser.dependency_graph.to_json(), index_file, indent=2)
+            index_file.write("\n")
 
-    schema_mapping = schema_mapping or {}
-    for schema_id, file_content in files.items():
-        file_name = schema_mapping.get(schema_id, f"{schema_id}.md")
+    if args.watch:
+        _watch(parser, args, schema_mapping)
 
-        with Path(file_name).open("w", encoding="utf-8") as output_file:
-            output_file.writelines(file_content)
+    if args.pre_commit and written:
+        import subprocess  # nosec # noqa: PLC0415 # pylint: disable=import-outside-toplevel
 
-    if args.pre_commit:
+        # Format all the written files at once
         subprocess.run(  # pylint: disable=subprocess-run-check # nosec # noqa: S603
-            ["pre-commit", "run", "--color=never", f"--files={args.output_markdown}"],  # noqa: S607,RUF100
+            [  # noqa: S607,RUF100
+                "pre-commit",
+                "run",
+                "--color=never",
+                "--files",
+                *(str(file) for file in written),
+            ],
             check=False,
         )
 
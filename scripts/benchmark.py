@@ -0,0 +1,147 @@
+# Copyright (c) 2026, Stéphane Brunner
+# ruff: noqa: INP001, D103
+import argparse
+import gettext
+import importlib.util
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import jsonschema2md
+
+
+def deep_schema(depth: int) -> dict[str, Any]:
+    """Get a schema with `depth` nested objects."""
+    schema: dict[str, Any] = {"type": "string", "description": "Leaf."}
+    for level in range(depth):
+        schema = {
+            "type": "object",
+            "description": f"Level {level}.",
+            "properties": {
+                f"level{level}": schema,
+                "count": {"type": "integer", "minimum": 0},
+            },
+        }
+    return {"type": "object", "properties": {"root": schema}}
+
+
+def wide_schema(width: int) -> dict[str, Any]:
+    """Get a schema with `width` sibling properties."""
+    return {
+        "type": "object",
+        "properties": {
+            f"property{index}": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "name": {"type": "string", "enum": ["foo", "bar", "baz"]},
+                    "values": {"type": "array", "items": {"type": "number", "maximum": 5}},
+                },
+            }
+            for index in range(width)
+        },
+    }
+
+
+# Messages of the description of a subschema
+MESSAGES = [
+    "Minimum: `%(min)d`.",
+    "Maximum: `%(max)d`.",
+    "Must be one of: %(enum)s.",
+    "Default: `%(default)s`.",
+    "required",
+    "deprecated",
+]
+
+
+def translate_gettext(translations: gettext.NullTranslations, count: int) -> None:
+    """Translate the messages with `gettext`, and the types through their lazy proxies."""
+    for _index in range(count):
+        for message in MESSAGES:
+            translations.gettext(message)
+        str(jsonschema2md.TYPES["string"])
+
+
+def translate_table(count: int) -> None:
+    """Translate the messages and the types with the message table of the current locale."""
+    for _index in range(count):
+        _ = jsonschema2md._get_messages()  # noqa: SLF001 # pylint: disable=protected-access
+        for message in MESSAGES:
+            _(message)
+        _.types["string"]  # pylint: disable=pointless-statement
+
+
+def load_baseline(directory: Path) -> Any:
+    """Import the package of another checkout, e.g. a worktree of the recursive implementation."""
+    spec = importlib.util.spec_from_file_location(
+        "jsonschema2md_baseline",
+        directory / "jsonschema2md" / "__init__.py",
+        submodule_search_locations=[str(directory / "jsonschema2md")],
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(name: str, function: Callable[[], Any], repeat: int) -> None:
+    try:
+        timings = timeit.repeat(function, number=1, repeat=repeat)
+    except RecursionError:
+        print(f"{name:<30} RecursionError")
+        return
+    print(f"{name:<30} best {min(timings) * 1000:9.2f} ms, mean {sum(timings) / repeat * 1000:9.2f} ms")
+
+
+def main() -> int:
+    argparser = argparse.ArgumentParser(description="Benchmark the JSON Schema to Markdown conversion.")
+    argparser.add_argument("--depth", type=int, default=300, help="Nesting depth of the deep schema.")
+    argparser.add_argument("--width", type=int, default=5000, help="Number of properties of the wide schema.")
+    argparser.add_argument("--repeat", type=int, default=5, help="Number of runs of each benchmark.")
+    argparser.add_argument("--messages", type=int, default=100000, help="Number of translated descriptions.")
+    argparser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Checkout to compare the deep and wide schemas with, e.g. the recursive implementation "
+        "from `git worktree add /tmp/baseline 61afd0a~1`.",
+    )
+    args = argparser.parse_args()
+
+    parser = jsonschema2md.Parser()
+    uncached_parser = jsonschema2md.Parser(fragment_cache_size=0)
+    deep = deep_schema(args.depth)
+    wide = wide_schema(args.width)
+
+    run(f"deep schema ({args.depth} levels)", lambda: parser.parse_schema(deep), args.repeat)
+    run("deep schema, no fragment cache", lambda: uncached_parser.parse_schema(deep), args.repeat)
+    run(f"wide schema ({args.width} properties)", lambda: parser.parse_schema(wide), args.repeat)
+    run("wide schema, no fragment cache", lambda: uncached_parser.parse_schema(wide), args.repeat)
+    if args.baseline is not None:
+        baseline_parser = load_baseline(args.baseline).Parser()
+        run("deep schema, baseline", lambda: baseline_parser.parse_schema(deep), args.repeat)
+        run("wide schema, baseline", lambda: baseline_parser.parse_schema(wide), args.repeat)
+
+    wide_ir = parser.build_ir(wide)
+    header_parser = jsonschema2md.Parser(header_level=1)
+    run("wide schema, IR build", lambda: parser.build_ir(wide), args.repeat)
+    run("wide schema, IR render", lambda: list(header_parser.render_ir(wide_ir)), args.repeat)
+
+    translations = gettext.translation(
+        "messages",
+        localedir=str(Path(jsonschema2md.__file__).parent / "locales"),
+        languages=["fr"],
+    )
+    jsonschema2md.Parser.current_locale = "fr"
+    run("messages, gettext", lambda: translate_gettext(translations, args.messages), args.repeat)
+    run("messages, message table", lambda: translate_table(args.messages), args.repeat)
+    run("wide schema, fr", lambda: parser.parse_schema(wide), args.repeat)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
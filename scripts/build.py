@@ -19,6 +19,18 @@ def initialize_options(compiler: CompileCatalog, **options: Any) -> None:
     compiler.ensure_finalized()  # type: ignore[no-untyped-call]
 
 
+def write_manifest(locales: Path, manifest: Path) -> None:
+    """Write the module listing the compiled locales, read by `jsonschema2md.get_locales`."""
+    languages = sorted(mo_file.parent.parent.name for mo_file in locales.glob("*/LC_MESSAGES/messages.mo"))
+    manifest.write_text(
+        "# Generated by scripts/build.py, don't edit.\n"
+        '"""The locales of the compiled translations."""\n\n'
+        f"LOCALES: tuple[str, ...] = {tuple(languages)!r}\n",
+        encoding="utf-8",
+    )
+    log.info("Wrote %s with the locales: %s.", manifest, ", ".join(languages))
+
+
 def main() -> int:
     locales = Path("jsonschema2md/locales")
     languages = tuple(lang for lang in locales.iterdir() if lang.is_dir())
@@ -41,6 +53,8 @@ def main() -> int:
     if not languages:
         log.info("No languages found.")
 
+    write_manifest(locales, Path("jsonschema2md/_locales.py"))
+
     return res
 
 
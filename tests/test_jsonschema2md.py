@@ -1,14 +1,25 @@
 # Copyright (c) 2026, Stéphane Brunner
 """Test jsonschema2md."""
 
+import concurrent.futures
 import contextlib
+import functools
+import http.server
 import io
 import json
+import os
+import pickle
+import subprocess
 import sys
+import tarfile
+import threading
+import time
+import zipfile
 from collections.abc import Generator
 from pathlib import Path
 from unittest import mock
 
+import babel.lists
 import pytest
 
 import jsonschema2md
@@ -738,6 +749,66 @@ class TestParser:
         ]
         assert expected_output == parser.parse_schema(test_schema)
 
+    def test_pattern_ignore_prefix(self):
+        test_schema = {
+            "type": "object",
+            "properties": {
+                "general": {"type": "string"},
+                "ignoreme": {"type": "object", "properties": {"thing": {"type": "string"}}},
+                "ignoremetoo": {"type": "integer"},
+                "other": {"allOf": [{"type": "string"}, {"minLength": 1}]},
+            },
+        }
+        parser = jsonschema2md.Parser(
+            ignore_patterns=["properties/ignoreme", r"properties/other/allOf/\d", "(a)\\1"],
+        )
+
+        assert parser.parse_schema(test_schema) == [
+            "# JSON Schema\n\n",
+            "## Properties\n\n",
+            '- <a id="properties/general"></a>**`general`** *(string)*\n',
+            '- <a id="properties/other"></a>**`other`**\n',
+            "  - **All of**\n",
+        ]
+        assert parser.ignore_pattern_hits == {
+            "properties/ignoreme": 3,
+            r"properties/other/allOf/\d": 2,
+            "(a)\\1": 0,
+        }
+        # The descriptions of the ignored subschemas aren't formatted
+        assert parser.fragment_cache_hits + parser.fragment_cache_misses == 2
+
+    def test_pattern_ignore_combined(self):
+        test_schema = {
+            "type": "object",
+            "properties": {"foo": {"type": "string"}, "bar": {"type": "string"}, "baz": {"type": "string"}},
+        }
+        parser = jsonschema2md.Parser(ignore_patterns=[".*/fo+$", ".*/ba(r|z)$", ".*/b.*"])
+
+        assert parser.parse_schema(test_schema) == ["# JSON Schema\n\n", "## Properties\n\n"]
+        assert parser.ignore_pattern_hits == {".*/fo+$": 1, ".*/ba(r|z)$": 2, ".*/b.*": 0}
+
+    @pytest.mark.parametrize(
+        "ignore_patterns",
+        [
+            ["(?i)PROPERTIES/FOO", ".*/bar$"],
+            ["(?P<name>.*/foo)$", "(?P<name>.*/bar)$"],
+        ],
+    )
+    def test_pattern_ignore_not_combined(self, ignore_patterns):
+        test_schema = {
+            "type": "object",
+            "properties": {"foo": {"type": "string"}, "bar": {"type": "string"}, "baz": {"type": "string"}},
+        }
+        parser = jsonschema2md.Parser(ignore_patterns=ignore_patterns)
+
+        assert parser.parse_schema(test_schema) == [
+            "# JSON Schema\n\n",
+            "## Properties\n\n",
+            '- <a id="properties/baz"></a>**`baz`** *(string)*\n',
+        ]
+        assert parser.ignore_pattern_hits == dict.fromkeys(ignore_patterns, 1)
+
     def test_collapse_children(self):
         test_schema = {
             "type": "object",
@@ -830,10 +901,284 @@ class TestParser:
         ]
         assert expected_output == parser.parse_schema(test_schema)
 
+    def test_iter_schema(self):
+        parser = jsonschema2md.Parser()
+
+        lines = parser.iter_schema(self.test_schema)
+
+        assert next(lines) == "# JSON Schema\n\n"
+        assert [*lines] == parser.parse_schema(self.test_schema)[1:]
+
+    def test_build_ir(self):
+        parser = jsonschema2md.Parser()
+
+        schema_ir = parser.build_ir(self.test_schema)
+
+        assert schema_ir[0] == jsonschema2md.DocumentHeader(None, "Food preferences")
+        # The nodes only hold the keywords of their description, not their children
+        nodes = [record for record in schema_ir if isinstance(record, jsonschema2md.SchemaNode)]
+        assert nodes
+        assert all(not jsonschema2md._CHILDREN_KEYWORDS & node.schema.keys() for node in nodes)
+        assert pickle.loads(pickle.dumps(schema_ir)) == schema_ir  # noqa: S301
+        assert list(parser.render_ir(schema_ir)) == parser.parse_schema(self.test_schema)
+        assert list(parser.render_ir(schema_ir)) == parser.parse_schema(self.test_schema)
+
+        collapsed_parser = jsonschema2md.Parser(header_level=1, collapse_children=True)
+        assert list(collapsed_parser.render_ir(schema_ir)) == collapsed_parser.parse_schema(
+            self.test_schema,
+        )
+
+        french_lines = list(parser.render_ir(schema_ir, locale="fr"))
+        assert jsonschema2md.Parser.current_locale is None
+        jsonschema2md.Parser.current_locale = "fr"
+        try:
+            assert french_lines == parser.parse_schema(self.test_schema)
+        finally:
+            jsonschema2md.Parser.current_locale = None
+
+    def test_render_ir_concurrent_locales(self):
+        schema_ir = jsonschema2md.Parser().build_ir(self.test_schema)
+        locales = ["en_US", "fr", "pt_BR", "fr_CH", "pt"] * 8
+        expected = {
+            locale: list(jsonschema2md.Parser().render_ir(schema_ir, locale=locale)) for locale in locales
+        }
+        assert expected["fr"] != expected["en_US"]
+        assert expected["pt_BR"] != expected["en_US"]
+
+        def render(locale: str) -> list[str]:
+            lines = []
+            # Interleave the renderings of the threads
+            for line in jsonschema2md.Parser().render_ir(schema_ir, locale=locale):
+                time.sleep(0)
+                lines.append(line)
+            return lines
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            outputs = list(executor.map(render, locales))
+
+        assert outputs == [expected[locale] for locale in locales]
+        assert jsonschema2md.Parser.current_locale is None
+        assert list(jsonschema2md.Parser().render_ir(schema_ir)) == expected["en_US"]
+
+    def test_render_ir_error_in_defs(self):
+        test_schema = {
+            "definitions": {
+                "invalid": {"type": "integer", "minimum": "zero"},
+                "valid": {"type": "integer", "minimum": 0},
+            },
+        }
+        parser = jsonschema2md.Parser()
+        schema_ir = parser.build_ir(test_schema)
+
+        with pytest.raises(ValueError, match=r"Error parsing invalid from definitions in schema"):
+            list(parser.render_ir(schema_ir))
+        assert list(parser.render_ir(schema_ir, fail_on_error_in_defs=False)) == [
+            "# JSON Schema\n\n",
+            "## Definitions\n\n",
+            '- <a id="definitions/valid"></a>**`valid`** *(integer)*: Minimum: `0`.\n',
+        ]
+
+    def test_fragment_cache(self):
+        test_schema = {
+            "type": "object",
+            "properties": {
+                "foo": {"type": "string", "format": "uuid", "description": "An identifier."},
+                "bar": {"type": "string", "format": "uuid", "description": "An identifier."},
+                "baz": {
+                    "type": "object",
+                    "properties": {
+                        "foo": {"type": "string", "format": "uuid", "description": "An identifier."},
+                        "ref": {"$ref": "https://example.com/definitions.json"},
+                    },
+                },
+                "ref": {"$ref": "https://example.com/definitions.json"},
+            },
+        }
+        parser = jsonschema2md.Parser(domain="example.com")
+
+        output = parser.parse_schema(test_schema)
+
+        assert output == jsonschema2md.Parser(domain="example.com", fragment_cache_size=0).parse_schema(
+            test_schema,
+        )
+        assert output[2:4] == [
+            '- <a id="properties/foo"></a>**`foo`** *(string, format: uuid)*: An identifier.\n',
+            '- <a id="properties/bar"></a>**`bar`** *(string, format: uuid)*: An identifier.\n',
+        ]
+        # Only `bar` is a hit, the children of `baz` are at another indentation level
+        assert (parser.fragment_cache_hits, parser.fragment_cache_misses) == (1, 5)
+        assert parser.seen_refs == {"definitions.json"}
+
+        parser.seen_refs = set()
+        parser.parse_schema(test_schema)
+
+        assert (parser.fragment_cache_hits, parser.fragment_cache_misses) == (7, 5)
+        assert parser.seen_refs == {"definitions.json"}
+
+    def test_fragment_cache_size(self):
+        test_schema = {"properties": {f"foo{index}": {"minimum": index} for index in range(10)}}
+        parser = jsonschema2md.Parser(fragment_cache_size=4)
+
+        parser.parse_schema(test_schema)
+        parser.parse_schema(test_schema)
+
+        assert len(parser._fragment_cache) == 4
+        assert (parser.fragment_cache_hits, parser.fragment_cache_misses) == (0, 20)
+
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() * 2
+        test_schema = {"type": "string"}
+        for level in range(depth):
+            test_schema = {"type": "object", "properties": {f"level{level}": test_schema}}
+        parser = jsonschema2md.Parser()
+
+        output = parser.parse_schema({"properties": {"root": test_schema}})
+
+        assert len(output) == depth + 3
+        assert output[-1].startswith(
+            " " * parser.tab_size * depth + '- <a id="properties/root/properties/level'
+        )
+        assert output[-1].endswith("</a>**`level0`** *(string)*\n")
+
+    def test_max_depth(self):
+        test_schema = {
+            "properties": {
+                "foo": {"type": "object", "properties": {"bar": {"type": "object", "properties": {}}}},
+            },
+        }
+
+        assert len(jsonschema2md.Parser(max_depth=1).parse_schema(test_schema)) == 4
+        with pytest.raises(
+            ValueError, match=r"Maximum schema depth of 0 exceeded at `properties/foo/properties/bar`\."
+        ):
+            jsonschema2md.Parser(max_depth=0).parse_schema(test_schema)
+
+    def test_inline_refs(self):
+        test_schema = {
+            "properties": {
+                "foo": {"$ref": "#/definitions/veggie"},
+                "bar": {"$ref": "#/definitions/alias", "description": "Through an alias."},
+                "baz": {"$ref": "#/definitions/loop"},
+            },
+            "definitions": {
+                "veggie": {
+                    "type": "object",
+                    "properties": {
+                        "veggieName": {"type": "string"},
+                        "child": {"$ref": "#/definitions/veggie"},
+                    },
+                },
+                "alias": {"$ref": "#/definitions/veggie"},
+                "loop": {"$ref": "#/definitions/loop"},
+            },
+        }
+        parser = jsonschema2md.Parser(inline_refs=1)
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            output = parser.parse_schema(test_schema)
+
+        assert f.getvalue() == "WARN: Circular reference `#/definitions/loop`.\n"
+        assert output[:10] == [
+            "# JSON Schema\n\n",
+            "## Properties\n\n",
+            '- <a id="properties/foo"></a>**`foo`** *(object)*\n',
+            '  - <a id="properties/foo/properties/veggieName"></a>**`veggieName`** *(string)*\n',
+            (
+                '  - <a id="properties/foo/properties/child"></a>**`child`**: Refer to '
+                "*[#/definitions/veggie](#definitions/veggie)*.\n"
+            ),
+            '- <a id="properties/bar"></a>**`bar`** *(object)*: Through an alias.\n',
+            '  - <a id="properties/bar/properties/veggieName"></a>**`veggieName`** *(string)*\n',
+            (
+                '  - <a id="properties/bar/properties/child"></a>**`child`**: Refer to '
+                "*[#/definitions/veggie](#definitions/veggie)*.\n"
+            ),
+            '- <a id="properties/baz"></a>**`baz`**: Refer to *[#/definitions/loop](#definitions/loop)*.\n',
+            "## Definitions\n\n",
+        ]
+
+    def test_inline_refs_keyword_names(self):
+        test_schema = {
+            "properties": {"foo": {"$ref": "#/definitions/default"}},
+            "definitions": {"default": {"type": "string"}},
+        }
+        parser = jsonschema2md.Parser(inline_refs=1)
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            output = parser.parse_schema(test_schema)
+
+        assert f.getvalue() == ""
+        assert output[2] == '- <a id="properties/foo"></a>**`foo`** *(string)*\n'
+
+
+class TestSchemaIndex:
+    """Test the JSON Pointer index."""
+
+    test_schema = {
+        "$id": "https://example.com/root.json",
+        "properties": {"a/b": {"type": "string"}, "c~d": {"$ref": "#/properties/a~1b"}},
+        "definitions": {
+            "anchored": {"$anchor": "node", "type": "integer"},
+            "nested": {"$id": "nested.json", "type": "object", "properties": {"e": {"type": "null"}}},
+            "loop1": {"$ref": "#/definitions/loop2"},
+            "loop2": {"$ref": "#/definitions/loop1"},
+        },
+        "examples": [{"$anchor": "example"}],
+    }
+
+    def test_resolve(self):
+        index = jsonschema2md.SchemaIndex(self.test_schema)
+
+        assert index.resolve("#") == ("", self.test_schema)
+        assert index.resolve("#/properties/a~1b") == ("/properties/a~1b", {"type": "string"})
+        assert index.resolve("#/properties/c~0d") == ("/properties/a~1b", {"type": "string"})
+        assert index.resolve("#node") == ("/definitions/anchored", {"$anchor": "node", "type": "integer"})
+        assert index.resolve("https://example.com/root.json#/definitions/anchored") == (
+            "/definitions/anchored",
+            {"$anchor": "node", "type": "integer"},
+        )
+        assert index.resolve("https://example.com/nested.json#/properties/e") == (
+            "/definitions/nested/properties/e",
+            {"type": "null"},
+        )
+        assert index.resolve("https://example.com/other.json#/definitions/foo") is None
+
+    def test_resolve_errors(self):
+        index = jsonschema2md.SchemaIndex(self.test_schema)
+
+        with pytest.raises(ValueError, match="Circular reference `#/definitions/loop1`"):
+            index.resolve("#/definitions/loop1")
+        with pytest.raises(ValueError, match="Unresolvable reference `#/definitions/missing`"):
+            index.resolve("#/definitions/missing")
+        with pytest.raises(ValueError, match="Unresolvable reference `#example`"):
+            index.resolve("#example")
+        assert set(index.errors) == {"#/definitions/loop1", "#/definitions/missing", "#example"}
+
+    def test_resolve_keyword_names(self):
+        schema = {
+            "properties": {"default": {"type": "string"}, "enum": {"type": "integer"}},
+            "definitions": {"examples": {"type": "null"}, "const": {"default": {"type": "object"}}},
+        }
+        index = jsonschema2md.SchemaIndex(schema)
+
+        assert index.resolve("#/properties/default") == ("/properties/default", {"type": "string"})
+        assert index.resolve("#/properties/enum") == ("/properties/enum", {"type": "integer"})
+        assert index.resolve("#/definitions/examples") == ("/definitions/examples", {"type": "null"})
+        # The value of the `default` keyword of a subschema isn't a subschema
+        with pytest.raises(ValueError, match="Unresolvable reference"):
+            index.resolve("#/definitions/const/default")
+
 
 class TestParserFR:
     """Test."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_locale(self) -> Generator[None]:
+        yield
+        jsonschema2md.Parser.current_locale = None
+
     test_schema = {
         "$id": "https://example.com/arrays.schema.json",
         "$schema": "http://json-schema.org/draft-07/schema#",
@@ -888,6 +1233,51 @@ class TestParserFR:
         ],
     }
 
+    @pytest.mark.parametrize("locale", jsonschema2md.get_locales())
+    @pytest.mark.parametrize(
+        "style",
+        ["standard", "standard-short", "or", "or-short", "unit", "unit-short", "unit-narrow"],
+    )
+    def test_format_list(self, locale, style):
+        for length in range(6):
+            items = [f"`item{index}`" for index in range(length)]
+            expected = babel.lists.format_list(items, style, locale)
+            assert jsonschema2md._format_list(items, style, locale) == expected
+            # From the memo
+            assert jsonschema2md._format_list(iter(items), style, locale) == expected
+
+    def test_get_locales(self, monkeypatch):
+        locales = ("en", "en_US", "fr", "fr_CH", "pt", "pt_BR")
+        jsonschema2md.get_locales.cache_clear()
+        try:
+            assert jsonschema2md.get_locales() == locales
+            assert jsonschema2md.get_locales() is jsonschema2md.get_locales()
+
+            # Without the manifest of the build, the compiled catalogs are listed
+            monkeypatch.setitem(sys.modules, "jsonschema2md._locales", None)
+            jsonschema2md.get_locales.cache_clear()
+            assert jsonschema2md.get_locales() == locales
+        finally:
+            jsonschema2md.get_locales.cache_clear()
+
+    def test_message_table(self):
+        messages = jsonschema2md._get_messages("fr")
+        assert messages is jsonschema2md._get_messages("fr")
+        assert messages("Properties") == "Propriétés"
+        assert messages["Unknown message"] == "Unknown message"
+        assert messages.types["string"] == "chaîne de caractères"
+        assert messages.keyword_names["$defs"] == "$defs"
+        assert messages.section_titles["$defs"] == "Définitions"
+
+        english_messages = jsonschema2md._get_messages("en_US")
+        assert english_messages("Properties") == "Properties"
+        assert english_messages.types["string"] == "string"
+
+        # The lazy labels are translated in the current locale
+        jsonschema2md.Parser.current_locale = "fr"
+        assert jsonschema2md._("Properties") == "Propriétés"
+        assert str(jsonschema2md.TYPES["string"]) == "chaîne de caractères"
+
     def test_construct_description_line(self):
         """Test."""
         test_cases = [
@@ -1522,6 +1912,8 @@ def open_mock(content: dict[str, str]) -> Generator[dict[str, mock.MagicMock]]:
 
     def side_effect(filename: str, mode: str = "r", *args, **kwargs):
         filename = str(filename)  # pathlib passes Path objects
+        if filename not in mapped_content:
+            raise FileNotFoundError(2, "File not found in mocked content.", filename)
         if "r" in mode:
             return mapped_content[filename]()
 
@@ -1529,9 +1921,14 @@ def open_mock(content: dict[str, str]) -> Generator[dict[str, mock.MagicMock]]:
         filename = str(filename)
         if filename not in mapped_content:
             raise FileNotFoundError(2, "File not found in mocked content.", filename)
+        return os.stat_result((0o100644, 0, 0, 1, 0, 0, len(content[filename]), 0, 0, 0))
 
     patch = mock.patch("io.open", side_effect=side_effect)
     stat_patch = mock.patch("os.stat", side_effect=stat_side_effect)
+    # The mocked files have no modification time
+    jsonschema2md.document_cache.invalidate()
+    # List the locales from the real files
+    jsonschema2md.get_locales()
     try:
         stat_patch.start()
         patch.start()
@@ -1539,6 +1936,7 @@ def open_mock(content: dict[str, str]) -> Generator[dict[str, mock.MagicMock]]:
     finally:
         stat_patch.stop()
         patch.stop()
+        jsonschema2md.document_cache.invalidate()
 
 
 @pytest.mark.skipif(
@@ -1782,3 +2180,996 @@ class TestExternalRefs:
                 '- <a id="properties/baz"></a>**`baz`** *(string)*: A nested string property.\n',
             ],
         }
+
+    def test_load_workers(self):
+        names = [f"schema{index}" for index in range(20)]
+        content = {
+            "root.json": json.dumps(
+                {
+                    "properties": {
+                        name: {"$ref": f"https://example.com/{name}.json"} for name in reversed(names)
+                    }
+                },
+            ),
+            **{f"{name}.json": json.dumps({"title": name}) for name in names},
+        }
+
+        parser = jsonschema2md.Parser(domain="example.com", load_workers=4)
+
+        with open_mock(content):
+            output = parser.parse_file(Path("root.json"))
+
+        assert list(output) == ["root", *sorted(names)]
+        assert output["schema7"] == ["# schema7\n\n"]
+        assert set(parser.load_times) == {"root.json", *(f"{name}.json" for name in names)}
+
+    def test_dependency_graph(self):
+        def schema(*refs):
+            return json.dumps(
+                {"properties": {ref: {"$ref": f"https://example.com/{ref}.json"} for ref in refs}}
+            )
+
+        content = {
+            "root.json": schema("a", "b"),
+            "a.json": schema("c"),
+            "b.json": schema("a"),
+            "c.json": schema("a", "d"),
+            "d.json": schema(),
+        }
+        parser = jsonschema2md.Parser(domain="example.com")
+
+        f = io.StringIO()
+        with open_mock(content), contextlib.redirect_stdout(f):
+            output = parser.parse_file(Path("root.json"), ref_depth=2)
+
+        assert list(output) == ["root", "a", "b", "c"]
+        assert f.getvalue() == "WARN: Reached maximum depth. Refusing to parse 1 remaining references!\n"
+        graph = parser.dependency_graph
+        assert graph.depths == {"root.json": 0, "a.json": 1, "b.json": 1, "c.json": 2, "d.json": 3}
+        assert graph.topological_order() == ["d.json", "a.json", "b.json", "c.json", "root.json"]
+        assert graph.to_json()["files"]["a.json"] == {
+            "depth": 1,
+            "references": ["c.json"],
+            "referenced_by": ["b.json", "c.json", "root.json"],
+        }
+        assert graph.to_dot().splitlines()[:2] == [
+            "digraph dependencies {",
+            '  "a.json" [label="a.json (1)"];',
+        ]
+        assert '  "c.json" -> "a.json";' in graph.to_dot().splitlines()
+
+    def test_iter_file(self):
+        parser = jsonschema2md.Parser(domain="example.com", relative=True)
+
+        with open_mock(self.content):
+            files = parser.iter_file(Path("root.json"), locale="en_US")
+            name, lines = next(files)
+            assert name == "root"
+            assert next(lines) == "# JSON Schema\n\n"
+            # The reference is discovered while the remaining lines are consumed
+            assert [(name, [*lines]) for name, lines in files] == [
+                (
+                    "definitions",
+                    [
+                        "# JSON Schema\n\n",
+                        "*Definitions schema.*\n\n",
+                        "## Properties\n\n",
+                        '- <a id="properties/bar"></a>**`bar`** *(string)*: A string property.\n',
+                    ],
+                ),
+            ]
+
+    def test_pattern_ignore_prefix(self, tmp_path):
+        (tmp_path / "root.json").write_text(
+            json.dumps(
+                {
+                    "properties": {
+                        "a": {
+                            "properties": {"b": {"$ref": "https://example.com/other.json"}},
+                            "examples": [{"b": "x"}],
+                        },
+                        "c": {"type": "string"},
+                    },
+                },
+            ),
+            encoding="utf-8",
+        )
+        (tmp_path / "other.json").write_text('{"description": "Other."}', encoding="utf-8")
+
+        prefix_parser = jsonschema2md.Parser(domain="example.com", ignore_patterns=["properties/a"])
+        regex_parser = jsonschema2md.Parser(domain="example.com", ignore_patterns=["properties/a.*"])
+        output = prefix_parser.parse_file(tmp_path / "root.json")
+
+        assert output == regex_parser.parse_file(tmp_path / "root.json")
+        assert output == {
+            "root": [
+                "# JSON Schema\n\n",
+                "## Properties\n\n",
+                "\n  Examples:\n",
+                '  ```json\n  {\n      "b": "x"\n  }\n  ```\n\n',
+                '- <a id="properties/c"></a>**`c`** *(string)*\n',
+            ],
+            "other": ["# JSON Schema\n\n", "*Other.*\n\n"],
+        }
+        assert prefix_parser.ignore_pattern_hits == {"properties/a": 2}
+        assert regex_parser.ignore_pattern_hits == {"properties/a.*": 2}
+
+    def test_jobs(self, tmp_path):
+        for level in range(4):
+            (tmp_path / f"level{level}.json").write_text(
+                json.dumps(
+                    {
+                        "description": f"Level {level}.",
+                        "properties": {
+                            f"child{index}": {"$ref": f"https://example.com/level{level + 1}.json"}
+                            for index in range(2)
+                        },
+                    },
+                ),
+                encoding="utf-8",
+            )
+
+        serial_parser = jsonschema2md.Parser(domain="example.com")
+        serial_output = serial_parser.parse_file(tmp_path / "level0.json", ref_depth=2, locale="fr")
+        parser = jsonschema2md.Parser(domain="example.com")
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            output = parser.parse_file(tmp_path / "level0.json", ref_depth=2, locale="fr", jobs=2)
+
+        assert output == serial_output
+        assert list(output) == ["level0", "level1", "level2"]
+        assert output["level1"][1] == "*Level 1.*\n\n"
+        assert output["level1"][2] == "## Propriétés\n\n"
+        assert f.getvalue() == "WARN: Reached maximum depth. Refusing to parse 1 remaining references!\n"
+        assert set(parser.load_times) == {"level0.json", "level1.json", "level2.json"}
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_parse_file_locales(self, tmp_path, jobs):
+        for name, content in self.content.items():
+            (tmp_path / name).write_text(content, encoding="utf-8")
+        locales = ["en_US", "fr", "pt_BR"]
+        expected = {
+            locale: jsonschema2md.Parser(domain="example.com").parse_file(
+                tmp_path / "root.json", locale=locale
+            )
+            for locale in locales
+        }
+
+        parser = jsonschema2md.Parser(domain="example.com")
+        with mock.patch.object(
+            jsonschema2md, "_load_schema_file", wraps=jsonschema2md._load_schema_file
+        ) as load:
+            output = parser.parse_file_locales(tmp_path / "root.json", locales, jobs=jobs)
+
+        assert output == expected
+        assert output["fr"]["root"] != output["en_US"]["root"]
+        assert parser.dependency_graph.depths == {"root.json": 0, "definitions.json": 1}
+        if jobs == 1:
+            # Each file is loaded once for all the locales
+            assert load.call_count == 2
+
+
+class TestDocumentCache:
+    """Test the process-wide document cache."""
+
+    def test_get(self, tmp_path):
+        document_cache = jsonschema2md.DocumentCache(max_size=100)
+        (tmp_path / "a.json").write_text('{"title": "A"}', encoding="utf-8")
+        (tmp_path / "b.json").write_text(json.dumps({"title": "B" * 75}), encoding="utf-8")
+
+        (tmp_path / "sub").mkdir()
+
+        text, document = document_cache.get(tmp_path / "a.json")
+        assert (text, document) == ('{"title": "A"}', {"title": "A"})
+        # The same document is shared
+        assert document_cache.get(tmp_path / "sub" / ".." / "a.json")[1] is document
+        assert (document_cache.hits, document_cache.misses) == (1, 1)
+
+        (tmp_path / "a.json").write_text('{"title": "AA"}', encoding="utf-8")
+        assert document_cache.get(tmp_path / "a.json")[1] == {"title": "AA"}
+        assert (document_cache.hits, document_cache.misses) == (1, 2)
+
+        document_cache.invalidate(tmp_path / "a.json")
+        document_cache.get(tmp_path / "a.json")
+        assert (document_cache.hits, document_cache.misses) == (1, 3)
+
+        # Above the maximum size, the least recently used file is evicted
+        document_cache.get(tmp_path / "b.json")
+        document_cache.get(tmp_path / "b.json")
+        document_cache.get(tmp_path / "a.json")
+        assert (document_cache.hits, document_cache.misses) == (2, 5)
+
+    def test_parse_file(self, tmp_path):
+        for name, content in TestExternalRefs.content.items():
+            (tmp_path / name).write_text(content, encoding="utf-8")
+        jsonschema2md.document_cache.invalidate()
+        hits = jsonschema2md.document_cache.hits
+
+        output = jsonschema2md.Parser(domain="example.com").parse_file(tmp_path / "root.json")
+        # Another parser doesn't load the files again
+        assert jsonschema2md.Parser(domain="example.com").parse_file(tmp_path / "root.json") == output
+        assert jsonschema2md.document_cache.hits == hits + 2
+
+
+@contextlib.contextmanager
+def http_server(directory: Path) -> Generator[tuple[str, list[int]]]:
+    """Serve the files of a directory over HTTP/1.1, get the URL and the client ports of the requests."""
+    ports = []
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            ports.append(self.client_address[1])
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(Handler, directory=str(directory))
+    )
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/schemas/", ports
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestHttpLoader:
+    """Test the loader of the referenced files from an HTTP server."""
+
+    def test_parse_file(self, tmp_path):
+        (tmp_path / "server" / "schemas").mkdir(parents=True)
+        (tmp_path / "server" / "schemas" / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"], encoding="utf-8"
+        )
+        expected = jsonschema2md.Parser(domain="example.com").parse_file(tmp_path / "root.json")
+        (tmp_path / "definitions.json").unlink()
+
+        with http_server(tmp_path / "server") as (url, ports):
+            loader = jsonschema2md.HttpLoader(url, cache_directory=tmp_path / "cache")
+            parser = jsonschema2md.Parser(domain="example.com", loader=loader)
+            assert parser.parse_file(tmp_path / "root.json") == expected
+            assert (loader.requests, loader.revalidated) == (1, 0)
+
+            # Revalidated with `Last-Modified`, on the same connection
+            assert parser.parse_file(tmp_path / "root.json") == expected
+            assert (loader.requests, loader.revalidated) == (2, 1)
+            assert len(set(ports)) == 1
+
+            with pytest.raises(FileNotFoundError):
+                loader.load("missing.json")
+
+            # The connections aren't pickled, for the processes of the jobs
+            assert pickle.loads(pickle.dumps(loader)).load("definitions.json")[1]["description"] == (  # noqa: S301
+                "Definitions schema."
+            )
+            loader.close()
+
+        # Offline, the files are read from the cache only
+        offline_loader = jsonschema2md.HttpLoader(url, cache_directory=tmp_path / "cache", offline=True)
+        parser = jsonschema2md.Parser(domain="example.com", loader=offline_loader)
+        assert parser.parse_file(tmp_path / "root.json") == expected
+        assert offline_loader.requests == 0
+        with pytest.raises(FileNotFoundError):
+            offline_loader.load("missing.json")
+
+    def test_threads(self, tmp_path):
+        (tmp_path / "schemas").mkdir()
+        names = [f"file{index}.json" for index in range(20)]
+        for name in names:
+            (tmp_path / "schemas" / name).write_text(json.dumps({"title": name}), encoding="utf-8")
+
+        with http_server(tmp_path) as (url, _ports):
+            loader = jsonschema2md.HttpLoader(url)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                documents = list(executor.map(lambda name: loader.load(name)[1], names))
+            loader.close()
+
+        assert [document["title"] for document in documents] == names
+        assert loader.requests == len(names)
+
+    def test_abstract(self):
+        class IncompleteLoader(jsonschema2md.Loader):
+            def location(self, name):
+                return name
+
+        with pytest.raises(TypeError):
+            IncompleteLoader()
+
+
+class TestArchiveLoader:
+    """Test the loaders of the files of the archives."""
+
+    @pytest.mark.parametrize("archive_name", ["schemas.zip", "schemas.tar", "schemas.tar.gz"])
+    def test_parse_file(self, tmp_path, archive_name):
+        for name, content in TestExternalRefs.content.items():
+            (tmp_path / name).write_text(content, encoding="utf-8")
+        expected = jsonschema2md.Parser(domain="example.com").parse_file(tmp_path / "root.json")
+
+        archive = tmp_path / archive_name
+        if archive_name.endswith(".zip"):
+            with zipfile.ZipFile(archive, "w") as zip_file:
+                for name in TestExternalRefs.content:
+                    zip_file.write(tmp_path / name, f"bundle/{name}")
+        else:
+            (tmp_path / "README.txt").write_text("Schemas.", encoding="utf-8")
+            with tarfile.open(archive, "w:gz" if archive_name.endswith(".gz") else "w") as tar_file:
+                for name in TestExternalRefs.content:
+                    tar_file.add(tmp_path / name, f"bundle/{name}")
+                tar_file.add(tmp_path / "README.txt", "bundle/README.txt")
+
+        parser = jsonschema2md.Parser(domain="example.com")
+        assert parser.parse_file(archive / "bundle" / "root.json") == expected
+
+        loader_class = jsonschema2md.ZipLoader if archive_name.endswith(".zip") else jsonschema2md.TarLoader
+        loader = pickle.loads(pickle.dumps(loader_class(archive, "bundle")))  # noqa: S301
+        assert loader.load("../bundle/definitions.json")[1]["description"] == "Definitions schema."
+        with pytest.raises(FileNotFoundError):
+            loader.load("missing.json")
+        if archive_name.endswith(".gz"):
+            # Only the JSON files of a compressed archive are kept
+            assert list(loader._contents) == [f"bundle/{name}" for name in TestExternalRefs.content]  # noqa: SLF001 # pylint: disable=protected-access
+        loader.close()
+
+    def test_abstract(self, tmp_path):
+        class IncompleteLoader(jsonschema2md._ArchiveLoader):  # noqa: SLF001 # pylint: disable=protected-access
+            def _open(self):
+                pass
+
+        with pytest.raises(TypeError):
+            IncompleteLoader(tmp_path / "schemas.zip")
+
+
+class TestRenderCache:
+    """Test the on-disk render cache."""
+
+    def test_set_error(self, tmp_path):
+        render_cache = jsonschema2md.RenderCache(tmp_path / "cache")
+        render_cache.set("key", ["# Title\n\n"], [])
+
+        with pytest.raises(TypeError):
+            render_cache.set("key", [object()], [])
+
+        # The temporary file is removed, the previous entry is kept
+        assert [path.name for path in (tmp_path / "cache").rglob("*")] == ["ke", "key.json"]
+        assert render_cache.get("key") == (["# Title\n\n"], [])
+
+    def test_parse_file(self, tmp_path):
+        for name, content in TestExternalRefs.content.items():
+            (tmp_path / name).write_text(content, encoding="utf-8")
+        render_cache = jsonschema2md.RenderCache(tmp_path / "cache")
+
+        output = jsonschema2md.Parser(domain="example.com", render_cache=render_cache).parse_file(
+            tmp_path / "root.json",
+        )
+        assert (render_cache.hits, render_cache.misses) == (0, 2)
+
+        # The references are followed from the cached entries
+        cached_output = jsonschema2md.Parser(domain="example.com", render_cache=render_cache).parse_file(
+            tmp_path / "root.json",
+        )
+        assert cached_output == output
+        assert list(output) == ["root", "definitions"]
+        assert (render_cache.hits, render_cache.misses) == (2, 2)
+
+        jsonschema2md.Parser(domain="example.com", render_cache=render_cache).parse_file(
+            tmp_path / "root.json",
+            locale="fr",
+        )
+        assert (render_cache.hits, render_cache.misses) == (2, 4)
+
+        (tmp_path / "definitions.json").write_text(json.dumps({"title": "Changed"}), encoding="utf-8")
+        changed_output = jsonschema2md.Parser(domain="example.com", render_cache=render_cache).parse_file(
+            tmp_path / "root.json",
+        )
+        assert changed_output["definitions"] == ["# Changed\n\n"]
+        assert (render_cache.hits, render_cache.misses) == (3, 5)
+
+    def test_evict(self, tmp_path):
+        render_cache = jsonschema2md.RenderCache(tmp_path, max_size=100, max_age=3600)
+        for index in range(4):
+            render_cache.set(f"key{index}", ["x" * 20], [])
+            os.utime(tmp_path / "ke" / f"key{index}.json", (index * 1000, time.time() - 1000 + index))
+        os.utime(tmp_path / "ke" / "key0.json", (0, time.time() - 7200))
+
+        # `key0` is too old, then `key1` is the least recently used
+        assert render_cache.evict() == 2
+        assert sorted(path.name for path in tmp_path.glob("*/*.json")) == ["key2.json", "key3.json"]
+        assert render_cache.get("key3") == (["x" * 20], [])
+        assert render_cache.get("key1") is None
+
+
+class TestMain:
+    """Test the command line interface."""
+
+    def test_main(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["jsonschema2md", "--domain=example.com", "--locale=en_US", "root.json", "root.md"],
+        )
+
+        jsonschema2md.main()
+
+        assert (tmp_path / "root.md").read_text(encoding="utf-8") == (
+            "# JSON Schema\n\n"
+            "*Root schema with external reference.*\n\n"
+            "## Properties\n\n"
+            '- <a id="properties/foo"></a>**`foo`**: Refer to *[https://example.com/definitions.json](./definitions.md#)*.\n'
+        )
+        assert (tmp_path / "definitions.md").read_text(encoding="utf-8") == (
+            "# JSON Schema\n\n"
+            "*Definitions schema.*\n\n"
+            "## Properties\n\n"
+            '- <a id="properties/bar"></a>**`bar`** *(string)*: A string property.\n'
+        )
+
+    def test_main_unchanged(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["jsonschema2md", "--domain=example.com", "--locale=en_US", "root.json", "root.md"],
+        )
+        jsonschema2md.main()
+        os.utime(tmp_path / "root.md", ns=(0, 0))
+        os.utime(tmp_path / "definitions.md", ns=(0, 0))
+        (tmp_path / "definitions.json").write_text(json.dumps({"title": "Changed"}), encoding="utf-8")
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert f.getvalue() == "1 files written, 1 unchanged.\n"
+        # The unchanged file is left untouched
+        assert (tmp_path / "root.md").stat().st_mtime_ns == 0
+        assert (tmp_path / "definitions.md").read_text(encoding="utf-8") == "# Changed\n\n"
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "definitions.json",
+            "definitions.md",
+            "root.json",
+            "root.md",
+        ]
+
+    def test_main_dependency_graph(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "jsonschema2md",
+                "--domain=example.com",
+                "--dependency-graph=graph.json",
+                "root.json",
+                "root.md",
+            ],
+        )
+
+        jsonschema2md.main()
+
+        assert json.loads((tmp_path / "graph.json").read_text(encoding="utf-8")) == {
+            "files": {
+                "definitions.json": {"depth": 1, "references": [], "referenced_by": ["root.json"]},
+                "root.json": {"depth": 0, "references": ["definitions.json"], "referenced_by": []},
+            },
+            "order": ["definitions.json", "root.json"],
+        }
+
+    def test_main_incremental(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        argv = ["jsonschema2md", "--domain=example.com", "--incremental=index.json", "root.json", "root.md"]
+        monkeypatch.setattr(sys, "argv", argv)
+
+        # Without index, all the files are rendered
+        jsonschema2md.main()
+
+        assert (tmp_path / "root.md").exists()
+        assert (tmp_path / "definitions.md").exists()
+        assert (tmp_path / "index.json").exists()
+
+        (tmp_path / "root.md").unlink()
+        (tmp_path / "definitions.json").write_text(
+            json.dumps(
+                {"title": "Definitions", "properties": {"bar": {"$ref": "https://example.com/nested.json"}}}
+            ),
+            encoding="utf-8",
+        )
+        (tmp_path / "nested.json").write_text(json.dumps({"title": "Nested"}), encoding="utf-8")
+        (tmp_path / "unrelated.json").write_text(json.dumps({"title": "Unrelated"}), encoding="utf-8")
+        monkeypatch.setattr(sys, "stdin", io.StringIO("definitions.json\nunrelated.json\n"))
+
+        jsonschema2md.main()
+
+        assert not (tmp_path / "root.md").exists()
+        assert not (tmp_path / "unrelated.md").exists()
+        assert (tmp_path / "definitions.md").read_text(encoding="utf-8").startswith("# Definitions\n\n")
+        assert (tmp_path / "nested.md").read_text(encoding="utf-8") == "# Nested\n\n"
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert index["order"] == ["nested.json", "definitions.json", "root.json"]
+        assert index["files"]["nested.json"]["depth"] == 2
+
+    def test_main_watch(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["jsonschema2md", "--domain=example.com", "--locale=en_US", "--watch", "root.json", "root.md"],
+        )
+        root_mtime = []
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                root_mtime.append((tmp_path / "root.md").stat().st_mtime_ns)
+                (tmp_path / "definitions.json").write_text(json.dumps({"title": "Changed"}), encoding="utf-8")
+            elif len(sleeps) == 3:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(time, "sleep", sleep)
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert sleeps == [0.1, 0.1, 0.1]
+        assert (tmp_path / "definitions.md").read_text(encoding="utf-8") == "# Changed\n\n"
+        assert (tmp_path / "root.md").stat().st_mtime_ns == root_mtime[0]
+        output = f.getvalue().splitlines()
+        assert output[0] == "2 files written, 0 unchanged."
+        assert output[1] == "Watching 2 files, press Ctrl+C to stop."
+        assert output[2].startswith("Rendered 1 files in ")
+        assert output[2].endswith(" ms, 1 written, 0 unchanged.")
+        assert len(output) == 3
+
+    def test_main_watch_missing_file(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["jsonschema2md", "--domain=example.com", "--locale=en_US", "--watch", "root.json", "root.md"],
+        )
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                # Atomic save of an editor, the file is missing during a poll
+                (tmp_path / "root.json").rename(tmp_path / "root.json.tmp")
+            elif len(sleeps) == 2:
+                (tmp_path / "root.json.tmp").write_text(
+                    json.dumps({"title": "Changed", "properties": {"a": {"$ref": "definitions.json"}}}),
+                    encoding="utf-8",
+                )
+                (tmp_path / "root.json.tmp").rename(tmp_path / "root.json")
+            elif len(sleeps) == 4:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(time, "sleep", sleep)
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert sleeps == [0.1, 0.1, 0.1, 0.1]
+        assert (tmp_path / "root.md").read_text(encoding="utf-8").startswith("# Changed\n")
+        output = f.getvalue().splitlines()
+        assert output[1] == "Watching 2 files, press Ctrl+C to stop."
+        assert output[2].startswith("ERROR: ")
+        assert output[3].startswith("Rendered 1 files in ")
+        assert output[3].endswith(" ms, 1 written, 0 unchanged.")
+        assert len(output) == 4
+
+    def test_main_render_cache_evict(self, tmp_path, monkeypatch):
+        for name in ("root.json", "other.json"):
+            (tmp_path / name).write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "jsonschema2md",
+                "--domain=example.com",
+                "--cache-dir=cache",
+                "root.json:root.md",
+                "other.json:other.md",
+            ],
+        )
+        evicted = []
+        monkeypatch.setattr(
+            jsonschema2md.RenderCache, "evict", lambda render_cache: evicted.append(render_cache) or 0
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            jsonschema2md.main()
+
+        # Once per run, after all the inputs
+        assert len(evicted) == 1
+        assert list((tmp_path / "cache").glob("*/*.json"))
+
+    def test_main_batch(self, tmp_path, monkeypatch):
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "schemas" / "root.json").write_text(
+            TestExternalRefs.content["root.json"], encoding="utf-8"
+        )
+        (tmp_path / "schemas" / "other.json").write_text(
+            TestExternalRefs.content["root.json"], encoding="utf-8"
+        )
+        (tmp_path / "schemas" / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        (tmp_path / "docs").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "jsonschema2md",
+                "--domain=example.com",
+                "--locale=en_US",
+                "schemas/[or]*.json",
+                "schemas/definitions.json:docs/definitions.md",
+            ],
+        )
+        loaded = []
+        load_schema_file = jsonschema2md._load_schema_file
+        monkeypatch.setattr(
+            jsonschema2md,
+            "_load_schema_file",
+            lambda loader, name: loaded.append(name) or load_schema_file(loader, name),
+        )
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert (tmp_path / "schemas" / "root.md").read_text(encoding="utf-8") == (
+            tmp_path / "schemas" / "other.md"
+        ).read_text(encoding="utf-8")
+        assert (tmp_path / "definitions.md").read_text(encoding="utf-8") == (
+            tmp_path / "docs" / "definitions.md"
+        ).read_text(encoding="utf-8")
+        # The referenced file is loaded once for the two files referencing it
+        assert loaded == ["other.json", "definitions.json", "root.json", "definitions.json"]
+        output = f.getvalue().splitlines()
+        assert [line.split(":")[0] for line in output[:3]] == [
+            "schemas/other.json",
+            "schemas/root.json",
+            "schemas/definitions.json",
+        ]
+        assert output[0].startswith("schemas/other.json: 2 files in ")
+        assert output[1].startswith("schemas/root.json: 1 files in ")
+        assert output[3].startswith("Rendered 4 files from 3 inputs in ")
+
+    def test_main_directory(self, tmp_path, monkeypatch):
+        (tmp_path / "schemas" / "sub").mkdir(parents=True)
+        (tmp_path / "schemas" / "person.json").write_text(
+            json.dumps(
+                {
+                    "title": "Person",
+                    "description": "A person.",
+                    "properties": {"address": {"$ref": "https://example.com/sub/address.json"}},
+                },
+            ),
+            encoding="utf-8",
+        )
+        (tmp_path / "schemas" / "sub" / "address.json").write_text(
+            json.dumps({"properties": {"owner": {"$ref": "https://example.com/person.json"}}}),
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["jsonschema2md", "--domain=example.com", "--locale=en_US", "schemas", "docs"],
+        )
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert f.getvalue() == "3 files written, 0 unchanged.\n"
+        assert "(./sub/address.md#)" in (tmp_path / "docs" / "person.md").read_text(encoding="utf-8")
+        assert "(../person.md#)" in (tmp_path / "docs" / "sub" / "address.md").read_text(encoding="utf-8")
+        assert (tmp_path / "docs" / "index.md").read_text(encoding="utf-8") == (
+            "# schemas\n\n- [Person](./person.md): A person.\n- **sub/**\n  - [address](./sub/address.md)\n"
+        )
+
+        # The files are rendered in parallel
+        parser = jsonschema2md.Parser(domain="example.com")
+        files = dict(parser.iter_directory(tmp_path / "schemas", jobs=2))
+        assert {name: "".join(lines) for name, lines in files.items()} == {
+            "person": (tmp_path / "docs" / "person.md").read_text(encoding="utf-8"),
+            "sub/address": (tmp_path / "docs" / "sub" / "address.md").read_text(encoding="utf-8"),
+        }
+        assert parser.directory_entries == {"person": ("Person", "A person."), "sub/address": (None, None)}
+
+    def test_main_locales(self, tmp_path, monkeypatch):
+        for name, content in TestExternalRefs.content.items():
+            (tmp_path / name).write_text(content, encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["jsonschema2md", "--domain=example.com", "--locales=en_US,fr", "root.json", "docs/root.md"],
+        )
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert f.getvalue() == "4 files written, 0 unchanged.\n"
+        for locale in ["en_US", "fr"]:
+            output = jsonschema2md.Parser(domain="example.com").parse_file(
+                tmp_path / "root.json", locale=locale
+            )
+            assert (tmp_path / "docs" / locale / "root.md").read_text(encoding="utf-8") == "".join(
+                output["root"]
+            )
+            assert (tmp_path / "docs" / locale / "definitions.md").read_text(encoding="utf-8") == "".join(
+                output["definitions"]
+            )
+
+        monkeypatch.setattr(sys, "argv", ["jsonschema2md", "--locales=fr,xx", "root.json", "root.md"])
+        with pytest.raises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+            jsonschema2md.main()
+
+    def test_parse_inputs(self, tmp_path, monkeypatch):
+        assert jsonschema2md._parse_inputs(["schema.json", "doc.md"]) == [
+            (Path("schema.json"), Path("doc.md"))
+        ]
+        monkeypatch.chdir(tmp_path)
+        Path("schema.json").write_text("{}", encoding="utf-8")
+        Path("other.json").write_text("{}", encoding="utf-8")
+        # Two files are always an input and an output, whatever the output name
+        assert jsonschema2md._parse_inputs(["schema.json", "out.markdown"]) == [
+            (Path("schema.json"), Path("out.markdown"))
+        ]
+        assert jsonschema2md._parse_inputs(["schema.json", "README"]) == [
+            (Path("schema.json"), Path("README"))
+        ]
+        assert jsonschema2md._parse_inputs(["schema.json", "other.json"]) == [
+            (Path("schema.json"), Path("other.json"))
+        ]
+        # With an output directory, all the arguments are input files
+        assert jsonschema2md._parse_inputs(["schema.json", "other.json"], Path("docs")) == [
+            (Path("schema.json"), Path("docs/schema.md")),
+            (Path("other.json"), Path("docs/other.md")),
+        ]
+        assert jsonschema2md._parse_inputs(["a.json", "b.json:docs/b.md"]) == [
+            (Path("a.json"), Path("a.md")),
+            (Path("b.json"), Path("docs/b.md")),
+        ]
+        with pytest.raises(ValueError, match="No file matches"):
+            jsonschema2md._parse_inputs(["missing/*.json"])
+        with pytest.raises(ValueError, match=r"Several inputs are written to docs/a\.md"):
+            jsonschema2md._parse_inputs(["a.json", "sub/a.json"], Path("docs"))
+
+    def test_main_output_name(self, tmp_path, monkeypatch):
+        (tmp_path / "schema.json").write_text(json.dumps({"title": "Schema"}), encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["jsonschema2md", "--locale=en_US", "schema.json", "out.markdown"])
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            jsonschema2md.main()
+
+        assert f.getvalue() == "1 files written, 0 unchanged.\n"
+        assert (tmp_path / "out.markdown").read_text(encoding="utf-8") == "# Schema\n\n"
+        assert not (tmp_path / "schema.md").exists()
+
+    def test_main_changed_files(self, tmp_path, monkeypatch):
+        (tmp_path / "root.json").write_text(TestExternalRefs.content["root.json"], encoding="utf-8")
+        (tmp_path / "other.json").write_text(json.dumps({"title": "Other"}), encoding="utf-8")
+        (tmp_path / "definitions.json").write_text(
+            TestExternalRefs.content["definitions.json"],
+            encoding="utf-8",
+        )
+        (tmp_path / "mapping.yaml").write_text("root: docs/root.md\n", encoding="utf-8")
+        (tmp_path / "docs").mkdir()
+        monkeypatch.chdir(tmp_path)
+        # As with the `jsonschema2md-files` hook, the staged files are given at the end
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "jsonschema2md",
+                "--pre-commit",
+                "--domain=example.com",
+                "--locale=en_US",
+                "--schema-mapping=mapping.yaml",
+                "--changed-files",
+                "root.json",
+            ],
+        )
+
+        with mock.patch("subprocess.run") as run:
+            jsonschema2md.main()
+
+        assert (tmp_path / "docs" / "root.md").exists()
+        assert (tmp_path / "definitions.md").exists()
+        assert not (tmp_path / "other.md").exists()
+        run.assert_called_once_with(
+            ["pre-commit", "run", "--color=never", "--files", "docs/root.md", "definitions.md"],
+            check=False,
+        )
+
+        # Only the changed input files are rendered
+        (tmp_path / "definitions.md").unlink()
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "jsonschema2md",
+                "--locale=en_US",
+                "--output-dir=.",
+                "root.json",
+                "other.json",
+                "--changed-files",
+                "other.json",
+            ],
+        )
+
+        jsonschema2md.main()
+
+        assert (tmp_path / "other.md").read_text(encoding="utf-8") == "# Other\n\n"
+        assert not (tmp_path / "root.md").exists()
+        assert not (tmp_path / "definitions.md").exists()
+
+        # The input files that reference a changed file are rendered
+        (tmp_path / "other.md").unlink()
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "jsonschema2md",
+                "--domain=example.com",
+                "--locale=en_US",
+                "--output-dir=.",
+                "root.json",
+                "other.json",
+                "--changed-files",
+                "definitions.json",
+            ],
+        )
+
+        jsonschema2md.main()
+
+        assert (tmp_path / "root.md").exists()
+        assert (tmp_path / "definitions.md").exists()
+        assert not (tmp_path / "other.md").exists()
+
+    def test_write_file(self, tmp_path):
+        write_file = jsonschema2md._write_file  # noqa: SLF001 # pylint: disable=protected-access
+        file = tmp_path / "docs" / "schema.md"
+
+        assert write_file(file, iter(["# Title\n", "\n", "Text.\n"]))
+        assert file.read_text(encoding="utf-8") == "# Title\n\nText.\n"
+        file.chmod(0o640)
+        modification_time = file.stat().st_mtime_ns
+
+        # Unchanged, the file is left untouched
+        assert not write_file(file, iter(["# Title\n", "\nText.\n"]))
+        assert file.stat().st_mtime_ns == modification_time
+
+        # Changed after a common start, longer or shorter, with the mode kept
+        for lines in (["# Title\n", "\n", "Other.\n"], ["# Title\n", "\nText.\nMore.\n"], ["# Title\n"]):
+            assert write_file(file, iter(lines))
+            assert file.read_text(encoding="utf-8") == "".join(lines)
+            assert file.stat().st_mode & 0o777 == 0o640
+
+        # Through a symbolic link, the target file is written
+        link = tmp_path / "link.md"
+        link.symlink_to(file)
+        assert write_file(link, iter(["# Linked\n"]))
+        assert link.is_symlink()
+        assert file.read_text(encoding="utf-8") == "# Linked\n"
+
+        # On error, the temporary file is removed and the file is kept
+        def failing_lines():
+            yield "# Other\n"
+            message = "Rendering error."
+            raise ValueError(message)
+
+        with pytest.raises(ValueError, match="Rendering error"):
+            write_file(file, failing_lines())
+        assert file.read_text(encoding="utf-8") == "# Linked\n"
+        assert sorted(path.name for path in file.parent.iterdir()) == ["schema.md"]
+
+    def test_main_version(self, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["jsonschema2md", "--version"])
+
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f), pytest.raises(SystemExit):
+            jsonschema2md.main()
+
+        assert f.getvalue().endswith(f" {jsonschema2md.__version__}\n")
+
+
+class TestImportTime:
+    """Test the time to import the package, for the start of the command line."""
+
+    # The budget of the import of the package in microseconds, the import takes about 50 ms, it's
+    # generous for the slow machines, the regressions are caught by the modules that aren't imported
+    budget = 500_000
+    # The dependencies, and the heavy standard modules that aren't needed by all the commands, are
+    # imported when they are used
+    lazy_modules = frozenset(
+        (
+            "markdown",
+            "yaml",
+            "babel",
+            "importlib.metadata",
+            "http.client",
+            "subprocess",
+            "tarfile",
+            "zipfile",
+        ),
+    )
+
+    def test_import_time(self):
+        environment = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+        command = [sys.executable, "-X", "importtime", "-c", "import jsonschema2md"]
+        # The first import compiles the bytecode
+        subprocess.run(command, env=environment, check=True, capture_output=True)
+        result = subprocess.run(command, env=environment, check=True, capture_output=True, text=True)
+
+        # The modules imported by the package are listed before it, nested in it
+        imported: dict[str, int] = {}
+        for line in result.stderr.splitlines():
+            _self_time, cumulative_time, name = line.removeprefix("import time:").split("|")
+            if not cumulative_time.strip().isdigit():
+                continue
+            if len(name) - len(name.lstrip()) == 1 and name.strip() != "jsonschema2md":
+                imported = {}
+            else:
+                imported[name.strip()] = int(cumulative_time)
+
+        assert not self.lazy_modules & imported.keys()
+        assert imported["jsonschema2md"] < self.budget